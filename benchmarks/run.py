@@ -0,0 +1,240 @@
+# Headless benchmarks for the game's hot paths. Results are printed (and
+# optionally written) as JSON so runs can be compared between versions.
+#
+#   python -m benchmarks.run [--quick] [--output results.json]
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+from dodgeball import config
+from dodgeball.assets import ImageAssets
+from dodgeball.leaderboard import Leaderboard
+from dodgeball.obstacles import COLORS
+from dodgeball.scores import ScoreLog
+from dodgeball.sprites import SpriteCache
+from dodgeball.text import HudText, TextCache
+from dodgeball.world import World, LEFT, RIGHT
+
+DENSITIES = (10, 100, 1000, 10000)
+SCORE_FILE_SIZES = (100, 1000, 10000, 100000)
+
+
+def stats(samples):
+    # Timing samples in seconds -> summary in microseconds
+    us = np.array(samples) * 1e6
+    return {
+        "samples": len(samples),
+        "mean_us": round(float(us.mean()), 2),
+        "p50_us": round(float(np.percentile(us, 50)), 2),
+        "p95_us": round(float(np.percentile(us, 95)), 2),
+        "max_us": round(float(us.max()), 2),
+    }
+
+
+def populated_world(density, seed=1):
+    # A world holding `density` obstacles spread over the screen that never
+    # ends; top_up() keeps the density constant as obstacles leave
+    world = World(seed=seed)
+    world.lives = 10 ** 9
+    rng = world.rng
+    for _ in range(density):
+        x = rng.randint(0, world.width - config.obstacle_width)
+        y = rng.randint(-config.obstacle_height, world.height)
+        world.obstacles.add(x, y, rng.randrange(len(COLORS)))
+    return world
+
+
+def top_up(world, density):
+    while world.obstacles.count < density:
+        world.spawn_obstacle()
+
+
+def bench_simulation(density, ticks):
+    world = populated_world(density)
+    samples = []
+    clock = time.perf_counter
+    for i in range(ticks):
+        inputs = LEFT if (i // 60) % 2 else RIGHT
+        start = clock()
+        world.step(inputs)
+        samples.append(clock() - start)
+        top_up(world, density)
+    return stats(samples)
+
+
+class FrameRenderer:
+    # Draws a frame the way game_loop() does
+
+    def __init__(self, screen, font):
+        self.screen = screen
+        self.font = font
+        self.sprites = SpriteCache()
+        self.images = ImageAssets()
+        self.score_hud = HudText(font, "Score: {}", config.WHITE)
+        self.level_hud = HudText(font, "Level: {}", config.WHITE)
+        self.name_text = font.render("Player: bench", True, config.WHITE)
+
+    def draw(self, world, alpha=0.5):
+        screen = self.screen
+        screen.fill(config.BLACK)
+        blits = []
+        if world.power_up:
+            blits.append(self.sprites.power_up_blit(world.power_up_rect(alpha)))
+        blits.extend(self.sprites.obstacle_blits(world.obstacles, alpha))
+        blits.append(self.sprites.ball_blit(world.ball_pos(alpha)))
+        screen.blits(blits, False)
+        screen.blit(self.score_hud.render(world.score), (10, 10))
+        screen.blit(self.level_hud.render(world.level), (10, 40))
+        screen.blit(self.name_text, (world.width - self.name_text.get_width() - 10, 10))
+        heart = self.images.get("heart.png", (30, 30))
+        screen.blits([(heart, (10 + i * 35, world.height - 40)) for i in range(3)], False)
+        pygame.display.flip()
+
+
+def bench_render(renderer, density, frames):
+    world = populated_world(density)
+    samples = []
+    clock = time.perf_counter
+    for _ in range(frames):
+        world.step(0)
+        top_up(world, density)
+        start = clock()
+        renderer.draw(world)
+        samples.append(clock() - start)
+    return stats(samples)
+
+
+def bench_fonts(font, iterations):
+    clock = time.perf_counter
+    results = {}
+
+    samples = []
+    for i in range(iterations):
+        start = clock()
+        font.render(f"Score: {i}", True, config.WHITE)
+        samples.append(clock() - start)
+    results["font_render_changing"] = stats(samples)
+
+    samples = []
+    for _ in range(iterations):
+        start = clock()
+        font.render("Player: bench", True, config.WHITE)
+        samples.append(clock() - start)
+    results["font_render_static"] = stats(samples)
+
+    cache = TextCache()
+    samples = []
+    for _ in range(iterations):
+        start = clock()
+        cache.render(font, "Player: bench", config.WHITE)
+        samples.append(clock() - start)
+    results["text_cache_static"] = stats(samples)
+
+    hud = HudText(font, "Score: {}", config.WHITE)
+    samples = []
+    for i in range(iterations):
+        start = clock()
+        hud.render(i // 30)  # The score changes every so often, not every frame
+        samples.append(clock() - start)
+    results["hud_text"] = stats(samples)
+    return results
+
+
+def bench_persistence(sizes, repeats):
+    from dodgeball import game
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        missing = os.path.join(tmp, "missing.json")
+        for size in sizes:
+            path = os.path.join(tmp, f"scores_{size}.jsonl")
+            with open(path, 'w') as f:
+                for i in range(size):
+                    f.write(json.dumps({"name": f"p{i % 50}", "score": i % 2000}) + "\n")
+            game.leaderboard = Leaderboard(ScoreLog(path, missing))
+            clock = time.perf_counter
+
+            samples = []
+            for _ in range(repeats):
+                start = clock()
+                game.load_scores()
+                samples.append(clock() - start)
+            load = stats(samples)
+
+            samples = []
+            for _ in range(repeats):
+                start = clock()
+                game.top_scores(5)
+                samples.append(clock() - start)
+            top = stats(samples)
+
+            samples = []
+            for i in range(repeats):
+                start = clock()
+                game.save_scores("bench", i)
+                samples.append(clock() - start)
+            results[str(size)] = {"load_scores": load, "top_scores": top, "save_scores": stats(samples)}
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "video_driver": os.environ["SDL_VIDEODRIVER"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the headless game benchmarks")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for a smoke run")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args()
+    ticks = 200 if args.quick else 2000
+    repeats = 5 if args.quick else 30
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    font = pygame.font.SysFont(None, 36)
+    renderer = FrameRenderer(screen, font)
+
+    results = {
+        "simulation_tick": {str(d): bench_simulation(d, ticks) for d in DENSITIES},
+        "render_frame": {str(d): bench_render(renderer, d, ticks // 4) for d in DENSITIES},
+        "fonts": bench_fonts(font, ticks),
+        "persistence": bench_persistence(SCORE_FILE_SIZES[:2] if args.quick else SCORE_FILE_SIZES,
+                                         repeats),
+    }
+    report = json.dumps({"meta": metadata(), "results": results}, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report + "\n")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
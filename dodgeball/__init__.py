@@ -0,0 +1,2 @@
+# Display-free game engine shared by the dodge_ball_*.py front ends
+from dodgeball.world import World, run_session, LEFT, RIGHT, UP, DOWN
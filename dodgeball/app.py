@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pygame
+
+from dodgeball import config, gpu
+from dodgeball.assets import ImageAssets
+from dodgeball.audio import SoundBank, play_music
+from dodgeball.sprites import SpriteCache
+
+# Assets loaded on the background thread by App.start()
+SOUND_EFFECTS = ("collision.wav", "power_up.wav")
+IMAGES = ("heart.png",)
+BACKGROUND_MUSIC = "bgm.wav"
+
+
+class App:
+    # Explicit bootstrap: creating an App touches no pygame subsystem.
+    # start() brings up only the display and fonts, then loads sounds,
+    # images and music on a background thread while the menu is already
+    # being drawn. timings holds the milliseconds spent in each phase.
+    #
+    # With renderer="gpu" the screen is a GpuScreen drawing through an SDL2
+    # hardware renderer if there is one; flip is then its present() and
+    # must be passed to DirtyRects and Menu. Otherwise (and on fallback)
+    # screen is the usual set_mode() surface and flip is None.
+
+    def __init__(self, width=config.WIDTH, height=config.HEIGHT, caption="Ball Dodger",
+                 report_timings=False, renderer=config.renderer):
+        self.width = width
+        self.height = height
+        self.caption = caption
+        self.report_timings = report_timings
+        self.renderer = renderer
+        self.screen = None
+        self.flip = None
+        self.clock = None
+        self.font = None
+        self.large_font = None
+        self.small_font = None
+        self.images = ImageAssets()
+        self.sounds = SoundBank()
+        self.sprites = SpriteCache()
+        self.assets_ready = threading.Event()
+        self.asset_error = None
+        self.timings = {}
+        self.created = time.perf_counter()
+        self._phase_start = self.created
+
+    def _phase(self, name):
+        now = time.perf_counter()
+        self.timings[name] = (now - self._phase_start) * 1000
+        self._phase_start = now
+
+    def start(self):
+        self._phase_start = time.perf_counter()
+        pygame.display.init()
+        pygame.font.init()
+        self._phase("init")
+
+        if self.renderer == "gpu":
+            self.screen = gpu.create_screen(self.caption, (self.width, self.height))
+        if self.screen is not None:
+            self.flip = self.screen.present
+        else:
+            self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
+            pygame.display.set_caption(self.caption)
+        self.clock = pygame.time.Clock()
+        self._phase("display")
+
+        self.font = pygame.font.SysFont(None, 36)
+        self.large_font = pygame.font.SysFont(None, 48)
+        self.small_font = pygame.font.SysFont("monospace", 16)
+        self._phase("fonts")
+
+        threading.Thread(target=self._load_assets, name="asset-loader", daemon=True).start()
+        return self
+
+    def _load_assets(self):
+        # assets_ready is set even if loading fails, so wait_for_assets()
+        # never hangs; it raises the stored error instead
+        started = time.perf_counter()
+        try:
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                pass  # No audio device; SoundBank and play_music stay silent
+            if pygame.mixer.get_init():
+                for name in SOUND_EFFECTS:
+                    self.sounds.get(name)
+            for name in IMAGES:
+                self.images.source(name)
+            play_music(BACKGROUND_MUSIC)
+        except Exception as e:
+            self.asset_error = e
+            raise
+        finally:
+            self.timings["assets"] = (time.perf_counter() - started) * 1000
+            self.assets_ready.set()
+        if self.report_timings:
+            print(f"startup: assets loaded in background in {self.timings['assets']:.1f} ms")
+
+    def wait_for_assets(self):
+        self.assets_ready.wait()
+        if self.asset_error is not None:
+            raise RuntimeError("loading assets failed") from self.asset_error
+
+    def first_frame(self):
+        # Call after presenting a frame; the first call records cold start
+        # to first frame
+        if "first_frame" in self.timings:
+            return
+        self.timings["first_frame"] = (time.perf_counter() - self.created) * 1000
+        if self.report_timings:
+            phases = ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.timings.items())
+            print(f"startup: {phases}")
+
+    def renderer_reset(self):
+        # Call on gpu.RESET_EVENTS, then redraw everything
+        if self.flip is not None:
+            self.screen.display_changed()
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+        if self.flip is None:
+            self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        # The GPU window resizes itself; the renderer follows it
+        self.sprites.invalidate()
+        self.images.display_changed()
+        return self.screen
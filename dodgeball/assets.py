@@ -0,0 +1,59 @@
+import os
+
+import pygame
+
+# Asset files live next to the dodge_ball_*.py scripts
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def asset_path(name):
+    return os.path.join(ASSET_DIR, name)
+
+
+class ImageAssets:
+    # Loads each image file once and hands out display-format copies,
+    # scaled variants cached by target size. Blitting an unconverted
+    # surface converts its pixels on every blit. After a display mode
+    # change call display_changed() so everything is converted again.
+    # smooth picks smoothscale (filtered) over scale (nearest neighbour).
+
+    def __init__(self, smooth=False):
+        self.smooth = smooth
+        self.sources = {}
+        self.surfaces = {}
+
+    def source(self, name):
+        image = self.sources.get(name)
+        if image is None:
+            image = pygame.image.load(asset_path(name))
+            self.sources[name] = image
+        return image
+
+    def get(self, name, size=None):
+        key = (name, size)
+        cached = self.surfaces.get(key)
+        if cached is not None and cached[1]:
+            return cached[0]
+        if cached is None:
+            surface = self.source(name)
+            if size is not None and surface.get_size() != size:
+                if self.smooth:
+                    if surface.get_bitsize() not in (24, 32):
+                        # smoothscale needs true color (heart.png is paletted)
+                        full = pygame.Surface(surface.get_size(), pygame.SRCALPHA, 32)
+                        full.blit(surface, (0, 0))
+                        surface = full
+                    surface = pygame.transform.smoothscale(surface, size)
+                else:
+                    surface = pygame.transform.scale(surface, size)
+        else:
+            surface = cached[0]
+        # Conversion needs a display; headless tools get the plain copy
+        converted = pygame.display.get_surface() is not None
+        if converted:
+            surface = surface.convert_alpha()
+        self.surfaces[key] = (surface, converted)
+        return surface
+
+    def display_changed(self):
+        self.surfaces.clear()
@@ -0,0 +1,61 @@
+import os
+
+import pygame
+
+from dodgeball.assets import asset_path
+
+# Compressed copies made by tools/build_audio.py are preferred when present
+COMPRESSED_EXT = ".ogg"
+
+
+def resolve(name):
+    # Path of the compressed version of an audio asset if it was built,
+    # otherwise of the original file
+    path = asset_path(name)
+    compressed = os.path.splitext(path)[0] + COMPRESSED_EXT
+    if compressed != path and os.path.exists(compressed):
+        return compressed
+    return path
+
+
+class SoundBank:
+    # Sound effects, each decoded once by get(). The game preloads them on
+    # App's asset thread; anything not loaded yet is decoded on first play.
+    # Does nothing when the mixer is not initialized (headless runs, no
+    # device).
+
+    def __init__(self):
+        self.sounds = {}
+
+    def get(self, name):
+        sound = self.sounds.get(name)
+        if sound is None:
+            path = resolve(name)
+            try:
+                sound = pygame.mixer.Sound(path)
+            except pygame.error:
+                if path == asset_path(name):
+                    raise
+                # A broken compressed copy; fall back to the original
+                sound = pygame.mixer.Sound(asset_path(name))
+            self.sounds[name] = sound
+        return sound
+
+    def play(self, name):
+        if pygame.mixer.get_init():
+            self.get(name).play()
+
+
+def play_music(name, loops=-1):
+    # pygame.mixer.music streams from disk, so even long tracks are never
+    # decoded into memory as a whole
+    if not pygame.mixer.get_init():
+        return
+    path = resolve(name)
+    try:
+        pygame.mixer.music.load(path)
+    except pygame.error:
+        if path == asset_path(name):
+            raise
+        pygame.mixer.music.load(asset_path(name))
+    pygame.mixer.music.play(loops)
@@ -0,0 +1,37 @@
+import numpy as np
+
+# Shared result for "nothing hit"; callers must not write to it
+NO_HITS = np.empty(0, dtype=np.intp)
+
+
+def aabb_hits(rect, xs, ys, width, height, out=None):
+    # Indices of every width x height box at (xs[i], ys[i]) that overlaps
+    # rect, tested in one pass. Same rule as pygame.Rect.colliderect.
+    # out is an optional pair of bool arrays as long as xs to work in, so
+    # that a test that hits nothing allocates nothing.
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+    if out is None:
+        hit = (xs < right) & (xs + width > left) & (ys < bottom) & (ys + height > top)
+        return np.flatnonzero(hit)
+    hit, test = out
+    np.less(xs, right, out=hit)
+    hit &= np.greater(xs, left - width, out=test)
+    hit &= np.less(ys, bottom, out=test)
+    hit &= np.greater(ys, top - height, out=test)
+    if not hit.any():
+        return NO_HITS
+    return np.flatnonzero(hit)
+
+
+def obstacle_hits(rect, obstacles, rows=None):
+    # Rows of the obstacles in an ObstaclePool that overlap rect, in spawn
+    # order. With rows (sorted, e.g. from a broadphase) only those are tested.
+    n = obstacles.count
+    if n == 0 or rect.width <= 0 or rect.height <= 0:
+        return NO_HITS
+    if rows is None:
+        return aabb_hits(rect, obstacles.x[:n], obstacles.y[:n], obstacles.width, obstacles.height,
+                         (obstacles.mask[:n], obstacles.scratch[:n]))
+    hit = aabb_hits(rect, obstacles.x[rows], obstacles.y[rows], obstacles.width, obstacles.height)
+    return rows[hit]
+
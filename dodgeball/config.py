@@ -0,0 +1,63 @@
+# Screen dimensions
+WIDTH, HEIGHT = 800, 600
+
+# Simulation runs at a fixed tick rate; every speed and duration below is
+# per tick. Rendering runs at up to max_fps and interpolates between ticks.
+TICK_RATE = 60
+max_fps = 144
+max_catch_up_ticks = 15
+
+# Frame pacing on battery-powered devices (dodge_ball_android.py): the
+# battery saver caps frames at battery_saver_fps, and a paused or
+# backgrounded game wakes at most idle_fps times a second
+battery_saver = False
+battery_saver_fps = 30
+idle_fps = 4
+
+# Only clear and push the areas that changed instead of fill + flip
+dirty_rects = False
+
+# "software" draws on the set_mode() surface; "gpu" draws textures through
+# an SDL2 hardware renderer, falling back to software when there is none
+renderer = "software"
+
+# Where scores and settings are kept: "json" files or "sqlite"
+storage_backend = "json"
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+GREEN = (0, 255, 0)
+YELLOW = (255, 255, 0)
+PURPLE = (128, 0, 128)
+CYAN = (0, 255, 255)
+GRAY = (128, 128, 128)
+
+# Obstacle colors and their corresponding speeds
+OBSTACLE_COLORS = {
+    WHITE: 3,
+    CYAN: 5,
+    BLUE: 7,
+    GREEN: 9,
+    YELLOW: 11,
+    PURPLE: 13,
+    RED: 15
+}
+
+# Game variables
+ball_radius = 15
+ball_speed = 7
+ball_speed_boost = 14
+ball_speed_boost_duration = 200
+obstacle_width = 50
+obstacle_height = 20
+obstacle_spawn_chance = 50
+power_up_width = 20
+power_up_height = 20
+power_up_speed = 3
+power_up_spawn_chance = 500
+power_up_color = YELLOW
+starting_lives = 3
+level_duration = 1000
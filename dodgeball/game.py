@@ -0,0 +1,477 @@
+# The game itself: menus, settings page, play loop and persistence. Every
+# dodge_ball_*.py script is a launcher that calls main() with a platform
+# profile (dodgeball.platforms), so all builds share this one code path.
+
+import argparse
+
+import pygame
+import sys
+import os
+import json
+
+from dodgeball.app import App
+from dodgeball import config
+from dodgeball.config import BLACK, GRAY, TICK_RATE, WHITE, dirty_rects, max_fps, storage_backend
+from dodgeball.gpu import RESET_EVENTS
+from dodgeball.layout import DPAD_ARROW_SIZE, ResizeDebouncer, layout_for
+from dodgeball.leaderboard import Leaderboard
+from dodgeball.menu import Button, Label, LineList, Menu, TextInput
+from dodgeball.pacing import FramePacer
+from dodgeball.platforms import PROFILES, detect
+from dodgeball.profiler import FrameProfiler
+from dodgeball.render import DirtyRects
+from dodgeball.replay import Recorder
+from dodgeball.scores import ScoreLog
+from dodgeball.sqlite_store import SqliteStore
+from dodgeball.text import HudText, render_text
+from dodgeball.timestep import FixedTimestep
+from dodgeball.touch import DpadTouch
+from dodgeball.writer import BackgroundWriter
+from dodgeball.world import World, LEFT, RIGHT, UP, DOWN, COLLISION, POWER_UP, GAME_OVER
+
+# Window size; changes when the window is resized
+WIDTH, HEIGHT = config.WIDTH, config.HEIGHT
+
+# Nothing is initialized at import: main() starts the app, which sets up
+# the display and fonts and loads sounds, images and music in the background
+app = App(WIDTH, HEIGHT)
+sounds = app.sounds
+images = app.images
+sprites = app.sprites
+HEART_SIZE = (30, 30)
+
+# Events after which the screen has to be drawn again in full
+REDRAW_EVENTS = (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE) + RESET_EVENTS
+
+# On-screen D-pad of touch profiles
+DPAD_FILL = (80, 80, 80)
+DPAD_OUTLINE = (150, 150, 150)
+
+# Window resizes are applied once a drag-resize settles; geometry for each
+# size comes from layout_for()
+resizes = ResizeDebouncer()
+
+# Frame phase timings; F3 toggles the overlay, and --profile-csv PATH or
+# --profile-trace PATH (Chrome trace JSON) dump every frame
+profiler = FrameProfiler()
+
+# Set by main() once the app has started
+profile = None
+screen = None
+clock = None
+font = None
+large_font = None
+
+# File paths
+SETTINGS_FILE = "settings.json"
+SCORES_FILE = "scores.jsonl"
+LEGACY_SCORES_FILE = "scores.json"  # Migrated into SCORES_FILE on first use
+DATABASE_FILE = "dodgeball.db"
+REPLAY_FILE = "last_replay.dbr"
+
+# Scores and settings live in JSON files, or in SQLite with
+# config.storage_backend = "sqlite" (the JSON files are imported once).
+# Nothing is opened until first use.
+if storage_backend == "sqlite":
+    database = SqliteStore(DATABASE_FILE, (SCORES_FILE, LEGACY_SCORES_FILE), SETTINGS_FILE)
+    score_store = database
+else:
+    database = None
+    score_store = ScoreLog(SCORES_FILE, LEGACY_SCORES_FILE)
+
+# Scores, settings and replays are written on a background thread so
+# game over and the settings page never wait on the disk; quit_game()
+# flushes it
+writer = BackgroundWriter()
+
+# Best scores kept in memory for the settings page
+leaderboard = Leaderboard(score_store, writer)
+
+# Default settings
+default_settings = {
+    "player_name": "Player",
+    "volume": 0.5
+}
+
+# The current settings; read from disk once, then kept up to date by
+# save_settings() so loading them never waits for a queued write
+current_settings = None
+
+def write_settings(settings):
+    if database:
+        database.save_settings(settings)
+        return
+    with open(SETTINGS_FILE, 'w') as f:
+        json.dump(settings, f)
+
+def read_settings():
+    if database:
+        return database.load_settings(default_settings)
+    if os.path.exists(SETTINGS_FILE):
+        with open(SETTINGS_FILE, 'r') as f:
+            return json.load(f)
+    return default_settings.copy()
+
+def load_settings():
+    global current_settings
+    if current_settings is None:
+        current_settings = read_settings()
+    return dict(current_settings)
+
+def save_settings(settings):
+    global current_settings
+    current_settings = dict(settings)
+    # Queued writes of the settings collapse into the latest one
+    writer.submit(write_settings, dict(settings), key="settings")
+
+def load_scores():
+    # Every score on disk; one still queued on the writer is not in it yet
+    return leaderboard.log.load()
+
+def top_scores(count):
+    return leaderboard.top(count)
+
+def save_scores(name, score, level=None, duration=None):
+    details = {}
+    if level is not None:
+        details["level"] = level
+    if duration is not None:
+        details["duration"] = duration
+    leaderboard.record(name, score, **details)
+
+def quit_game():
+    writer.flush()
+    if database:
+        database.close()
+    profiler.close()
+    pygame.quit()
+    sys.exit()
+
+def update_window_size(width, height):
+    global WIDTH, HEIGHT, screen
+    WIDTH, HEIGHT = width, height
+    screen = app.resize(WIDTH, HEIGHT)
+
+def apply_resize():
+    # Apply a window resize once the size has settled; True if it changed
+    size = resizes.poll()
+    if size is None or size == (WIDTH, HEIGHT):
+        return False
+    update_window_size(*size)
+    return True
+
+def build_settings_page(player_name):
+    layout = layout_for(WIDTH, HEIGHT)
+    menu = Menu(BLACK, app.flip)
+    menu.add(Label(large_font, "Settings", WHITE, midtop=layout.settings_title_midtop))
+    menu.add(Label(font, "Player Name:", WHITE, topleft=layout.name_label_topleft))
+    name_input = menu.add(TextInput(font, player_name, WHITE, GRAY, layout.name_input))
+    menu.add(Label(font, "High Scores", WHITE, midtop=layout.scores_title_midtop))
+    menu.add(LineList(lambda: leaderboard.render_lines(font, WHITE, 5), 40, midtop=layout.scores_midtop))
+    back_button = menu.add(Button(font, "Back to Game", WHITE, layout.back_button))
+    return menu, name_input, back_button
+
+def show_settings_page():
+    settings = load_settings()
+    menu, name_input, back_button = build_settings_page(settings["player_name"])
+    built_for = (WIDTH, HEIGHT)
+
+    while True:
+        apply_resize()
+        if built_for != (WIDTH, HEIGHT):
+            active = name_input.active
+            menu, name_input, back_button = build_settings_page(name_input.text)
+            name_input.active = active
+            built_for = (WIDTH, HEIGHT)
+        menu.draw(screen)
+
+        for event in menu.wait(resizes.wake_in()):
+            if event.type == pygame.QUIT:
+                quit_game()
+
+            if event.type == pygame.VIDEORESIZE:
+                resizes.push(event)
+            if event.type in RESET_EVENTS:
+                app.renderer_reset()
+            if event.type in REDRAW_EVENTS:
+                menu.invalidate()
+
+            if (event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN
+                    and name_input.active and name_input.text.strip()):
+                settings["player_name"] = name_input.text
+                save_settings(settings)
+
+            if back_button.clicked(event):
+                if name_input.text.strip():
+                    settings["player_name"] = name_input.text
+                    save_settings(settings)
+                return
+
+            menu.handle(event)
+
+def build_main_menu():
+    layout = layout_for(WIDTH, HEIGHT)
+    menu = Menu(BLACK, app.flip)
+    menu.add(Label(large_font, "Ball Dodger", WHITE, midtop=layout.title_midtop))
+    play_button = menu.add(Button(font, "Play", WHITE, layout.play_button))
+    settings_button = menu.add(Button(font, "Settings", WHITE, layout.settings_button))
+    quit_button = menu.add(Button(font, "Quit", WHITE, layout.quit_button))
+    return menu, play_button, settings_button, quit_button
+
+def show_main_menu():
+    menu, play_button, settings_button, quit_button = build_main_menu()
+    built_for = (WIDTH, HEIGHT)
+
+    while True:
+        # Also catches a resize that happened on the settings page
+        apply_resize()
+        if built_for != (WIDTH, HEIGHT):
+            menu, play_button, settings_button, quit_button = build_main_menu()
+            built_for = (WIDTH, HEIGHT)
+        menu.draw(screen)
+        app.first_frame()
+
+        for event in menu.wait(resizes.wake_in()):
+            if event.type == pygame.QUIT:
+                quit_game()
+
+            if event.type == pygame.VIDEORESIZE:
+                resizes.push(event)
+            if event.type in RESET_EVENTS:
+                app.renderer_reset()
+            if event.type in REDRAW_EVENTS:
+                menu.invalidate()
+
+            if play_button.clicked(event):
+                return "play"
+            elif settings_button.clicked(event):
+                show_settings_page()
+                menu.invalidate()
+            elif quit_button.clicked(event):
+                quit_game()
+
+            menu.handle(event)
+
+def read_inputs():
+    keys = pygame.key.get_pressed()
+    inputs = 0
+    if keys[pygame.K_LEFT]:
+        inputs |= LEFT
+    if keys[pygame.K_RIGHT]:
+        inputs |= RIGHT
+    if keys[pygame.K_UP]:
+        inputs |= UP
+    if keys[pygame.K_DOWN]:
+        inputs |= DOWN
+    return inputs
+
+def game_loop():
+    world = World(WIDTH, HEIGHT)
+    world.profiler = profiler
+    recorder = Recorder(world)
+    timestep = FixedTimestep()
+    settings = load_settings()
+    player_name = settings["player_name"]
+    # Have the best scores in memory before this game's score is queued,
+    # so the settings page never has to wait for the write
+    leaderboard.top(0)
+    score_hud = HudText(font, "Score: {}", WHITE)
+    level_hud = HudText(font, "Level: {}", WHITE)
+
+    dirty = DirtyRects(dirty_rects, app.flip)
+
+    layout = layout_for(WIDTH, HEIGHT)
+    touch = None
+    if profile.touch_controls:
+        touch = DpadTouch()
+        touch.layout(layout.dpad_center, DPAD_ARROW_SIZE, (WIDTH, HEIGHT))
+    pacer = FramePacer(clock) if profile.battery_pacing else None
+
+    running = True
+    paused = False
+    pause_shown = False
+    # What the last drawn frame showed, for skipping frames that would
+    # look the same (battery pacing only)
+    last_frame = None
+    # Milliseconds since the last frame, from the end-of-frame wait; zero
+    # on the first frame and after a pause, so the time spent in the menu
+    # or paused is not simulated
+    dt = 0
+    clock.tick()
+
+    while running:
+        profiler.begin_frame()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                quit_game()
+            elif event.type == pygame.VIDEORESIZE:
+                resizes.push(event)
+                dirty.invalidate()
+            elif event.type == pygame.VIDEOEXPOSE:
+                dirty.invalidate()
+            elif event.type in RESET_EVENTS:
+                app.renderer_reset()
+                dirty.invalidate()
+            elif event.type in (pygame.APP_WILLENTERBACKGROUND, pygame.WINDOWMINIMIZED):
+                # Hidden: pause rather than play on unseen
+                if profile.battery_pacing:
+                    paused = True
+                if touch:
+                    touch.release_all()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    paused = not paused
+                    pause_shown = False
+                    timestep.reset()
+                    dt = 0
+                elif event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
+                    dirty.invalidate()
+            elif touch:
+                if paused and event.type in (pygame.FINGERDOWN, pygame.MOUSEBUTTONDOWN):
+                    # No space bar on a phone: a tap resumes
+                    paused = False
+                    timestep.reset()
+                    dt = 0
+                else:
+                    touch.handle(event)
+        if apply_resize():
+            recorder.resize(WIDTH, HEIGHT)
+            layout = layout_for(WIDTH, HEIGHT)
+            dirty.invalidate()
+            if touch:
+                touch.layout(layout.dpad_center, DPAD_ARROW_SIZE, (WIDTH, HEIGHT))
+            if pacer:
+                pacer.display_changed()
+        profiler.mark("events")
+
+        # With battery pacing a paused frame is drawn once, then the loop
+        # just sleeps until something happens
+        if pacer and paused and pause_shown and not dirty.full:
+            dt = pacer.wait(True)
+            profiler.mark("wait")
+            profiler.end_frame()
+            continue
+
+        if not paused:
+            # Run as many fixed ticks as the elapsed time calls for, so game
+            # speed does not depend on how fast frames are drawn
+            inputs = read_inputs()
+            if touch:
+                inputs |= touch.held
+            for _ in range(timestep.advance(dt)):
+                for event in recorder.step(inputs):
+                    if event == COLLISION:
+                        sounds.play('collision.wav')
+                    elif event == POWER_UP:
+                        sounds.play('power_up.wav')
+                    elif event == GAME_OVER:
+                        save_scores(player_name, world.score, world.level,
+                                    round(world.ticks / TICK_RATE, 2))
+                        writer.submit(recorder.replay.save, REPLAY_FILE)
+                        return
+                profiler.mark("audio")
+
+        # With battery pacing a frame in which nothing moves (no obstacles
+        # or power-up, ball at rest) and the HUD is unchanged is not drawn
+        frame = None
+        if (pacer and not paused and not dirty.full and not profiler.overlay
+                and not world.obstacles.count and not world.power_up
+                and (world.ball_x, world.ball_y) == (world.prev_ball_x, world.prev_ball_y)):
+            frame = (world.ball_x, world.ball_y, world.score, world.level, world.lives)
+            if frame == last_frame:
+                dt = pacer.wait(False)
+                profiler.mark("wait")
+                profiler.end_frame()
+                continue
+        last_frame = frame
+        dirty.clear(screen, BLACK)
+
+        if not paused or pacer:
+            # Draw game elements between the last two ticks. With battery
+            # pacing the paused game stays on screen under the pause text.
+            alpha = timestep.alpha
+            blits = []
+            if world.power_up:
+                blits.append(sprites.power_up_blit(world.power_up_rect(alpha)))
+            blits.extend(sprites.obstacle_blits(world.obstacles, alpha))
+            blits.append(sprites.ball_blit(world.ball_pos(alpha)))
+            dirty.extend(screen.blits(blits, dirty.enabled))
+            profiler.mark("sprites")
+
+            # Draw UI
+            dirty.add(screen.blit(score_hud.render(world.score), layout.score_pos))
+            dirty.add(screen.blit(level_hud.render(world.level), layout.level_pos))
+
+            name_text = render_text(font, f"Player: {player_name}", WHITE)
+            dirty.add(screen.blit(name_text, (layout.hud_right - name_text.get_width(), 10)))
+            profiler.mark("hud")
+
+            # Draw lives
+            heart_image = images.get("heart.png", HEART_SIZE)
+            dirty.extend(screen.blits([(heart_image, pos) for pos in layout.hearts[:world.lives]],
+                                      dirty.enabled))
+            profiler.mark("hearts")
+
+        if paused:
+            pause_text = render_text(font, f"PAUSED - {'Tap' if touch else 'Press SPACE'} to Continue",
+                                     WHITE)
+            dirty.add(screen.blit(pause_text, pause_text.get_rect(midtop=layout.pause_center)))
+            pause_shown = True
+
+        if touch:
+            dirty.add(screen.blit(*sprites.dpad_blit(layout.dpad_center, DPAD_ARROW_SIZE,
+                                                     DPAD_FILL, DPAD_OUTLINE)))
+
+        if profiler.overlay:
+            dirty.add(profiler.draw(screen, app.small_font, WHITE))
+            profiler.mark("overlay")
+
+        dirty.present()
+        profiler.mark("present")
+        if pacer:
+            dt = pacer.wait(paused)
+        else:
+            dt = clock.tick(max_fps)
+        profiler.mark("wait")
+        profiler.end_frame()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Ball Dodger")
+    parser.add_argument("--platform", choices=PROFILES,
+                        help="platform profile (default: the one we are running on)")
+    parser.add_argument("--renderer", choices=("software", "gpu"), default=app.renderer,
+                        help="draw in software or through an SDL2 hardware renderer")
+    parser.add_argument("--timings", action="store_true",
+                        help="print how long each startup phase took")
+    parser.add_argument("--profile-csv", metavar="PATH", help="write per-frame phase timings as CSV")
+    parser.add_argument("--profile-trace", metavar="PATH",
+                        help="write per-frame phase timings as Chrome trace JSON")
+    return parser.parse_args(argv)
+
+def main(platform=None):
+    # platform is a dodgeball.platforms.Profile; by default the one for
+    # where we run (or --platform NAME)
+    global profile, screen, clock, font, large_font
+    args = parse_args()
+    if platform is None:
+        platform = PROFILES[args.platform] if args.platform else detect()
+    profile = platform
+    sprites.power_up_border = profile.power_up_border
+    images.smooth = profile.smooth_scaling
+    app.renderer = args.renderer
+    app.report_timings = args.timings
+    app.start()
+    screen, clock = app.screen, app.clock
+    font, large_font = app.font, app.large_font
+    if args.profile_csv:
+        profiler.start_csv(args.profile_csv)
+    if args.profile_trace:
+        profiler.start_trace(args.profile_trace)
+
+    while True:
+        action = show_main_menu()
+        if action == "play":
+            app.wait_for_assets()
+            game_loop()
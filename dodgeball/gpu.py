@@ -0,0 +1,95 @@
+import sys
+from collections import OrderedDict
+
+import pygame
+
+try:
+    from pygame._sdl2.sdl2 import error as SDLError
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:  # pygame built without the _sdl2 module
+    Renderer = None
+
+# Events after which a renderer's textures are gone (Android sends them
+# when the app comes back from the background)
+RESET_EVENTS = (pygame.RENDER_TARGETS_RESET, pygame.RENDER_DEVICE_RESET)
+
+
+def create_screen(caption, size):
+    # A GpuScreen on a new window with a hardware-accelerated renderer, or
+    # None (and a note on stderr) when there is no accelerator, as on the
+    # dummy/software video drivers; the caller then uses set_mode()
+    if Renderer is None:
+        print("renderer: pygame._sdl2 not available, using software rendering", file=sys.stderr)
+        return None
+    window = Window(caption, size=size, resizable=True)
+    try:
+        renderer = Renderer(window, accelerated=1)
+    except SDLError as e:
+        window.destroy()
+        print(f"renderer: no hardware renderer ({e}), using software rendering", file=sys.stderr)
+        return None
+    return GpuScreen(window, renderer)
+
+
+class GpuScreen:
+    # Stands in for the display Surface when drawing through an SDL2
+    # Renderer. It has the parts of the Surface API the game draws with
+    # (fill, blit, blits, get_size, get_width, get_height), so the menus and
+    # game loop draw the same way on either path. Every surface becomes a
+    # texture the first time it is drawn; textures are cached by surface
+    # (LRU), so sprites, hearts and text are uploaded once and then drawn
+    # as textured quads. The frame is undefined after present(), so draw
+    # every frame in full (DirtyRects and Menu do when given flip=present).
+
+    def __init__(self, window, renderer, maxsize=256):
+        self.window = window
+        self.renderer = renderer
+        self.maxsize = maxsize
+        self.textures = OrderedDict()
+
+    def get_size(self):
+        return self.window.size
+
+    def get_width(self):
+        return self.window.size[0]
+
+    def get_height(self):
+        return self.window.size[1]
+
+    def texture(self, surface):
+        texture = self.textures.get(surface)
+        if texture is not None:
+            self.textures.move_to_end(surface)
+            return texture
+        texture = Texture.from_surface(self.renderer, surface)
+        self.textures[surface] = texture
+        if len(self.textures) > self.maxsize:
+            self.textures.popitem(last=False)
+        return texture
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+            return pygame.Rect((0, 0), self.window.size)
+        rect = pygame.Rect(rect)
+        self.renderer.fill_rect(rect)
+        return rect
+
+    def blit(self, surface, dest, area=None):
+        w, h = surface.get_size() if area is None else (area[2], area[3])
+        rect = pygame.Rect(dest[0], dest[1], w, h)
+        self.texture(surface).draw(srcrect=area, dstrect=rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def present(self):
+        self.renderer.present()
+
+    def display_changed(self):
+        # Textures belong to the renderer; drop them after a RESET_EVENTS
+        # event so they are uploaded again as they are drawn
+        self.textures.clear()
@@ -0,0 +1,80 @@
+import functools
+
+import pygame
+
+from dodgeball import config
+
+# A resize is applied once the window size has stayed put this long, so a
+# drag-resize costs one set_mode() instead of one per VIDEORESIZE
+RESIZE_SETTLE_MS = 150
+
+# On-screen D-pad of touch profiles, kept in the bottom-left corner
+DPAD_MARGIN = 100
+DPAD_ARROW_SIZE = 40
+
+
+class Layout:
+    # Geometry of every screen for one window size: menu widgets, HUD and
+    # D-pad. Nothing here depends on anything but the size, so it is
+    # computed once per size by layout_for() and shared.
+
+    def __init__(self, width, height):
+        self.size = (width, height)
+        cx = width // 2
+
+        # Main menu
+        self.title_midtop = (cx, 100)
+        self.play_button = pygame.Rect(cx - 100, 250, 200, 50)
+        self.settings_button = pygame.Rect(cx - 100, 320, 200, 50)
+        self.quit_button = pygame.Rect(cx - 100, 390, 200, 50)
+
+        # Settings page
+        self.settings_title_midtop = (cx, 50)
+        self.name_label_topleft = (cx - 200, 120)
+        self.name_input = pygame.Rect(cx - 200, 150, 400, 40)
+        self.scores_title_midtop = (cx, 250)
+        self.scores_midtop = (cx, 300)
+        self.back_button = pygame.Rect(cx - 100, height - 100, 200, 50)
+
+        # In game
+        self.score_pos = (10, 10)
+        self.level_pos = (10, 40)
+        self.hud_right = width - 10
+        self.hearts = [(10 + i * 35, height - 40) for i in range(config.starting_lives)]
+        self.pause_center = (cx, height // 2)
+        self.dpad_center = (DPAD_MARGIN, height - DPAD_MARGIN)
+
+
+@functools.lru_cache(maxsize=8)
+def layout_for(width, height):
+    return Layout(width, height)
+
+
+class ResizeDebouncer:
+    # Collects VIDEORESIZE events and reports the final size once it has
+    # been stable for settle_ms
+
+    def __init__(self, settle_ms=RESIZE_SETTLE_MS):
+        self.settle_ms = settle_ms
+        self.pending = None
+        self.since = 0
+
+    def push(self, event):
+        self.pending = (event.w, event.h)
+        self.since = pygame.time.get_ticks()
+
+    def poll(self):
+        # The new (width, height) once it has settled, else None
+        if self.pending is None:
+            return None
+        if pygame.time.get_ticks() - self.since < self.settle_ms:
+            return None
+        size = self.pending
+        self.pending = None
+        return size
+
+    def wake_in(self):
+        # Milliseconds until poll() can report, or None
+        if self.pending is None:
+            return None
+        return max(0, self.settle_ms - (pygame.time.get_ticks() - self.since))
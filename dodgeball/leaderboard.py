@@ -0,0 +1,56 @@
+from dodgeball.scores import best
+
+
+class Leaderboard:
+    # In-memory top-K over a ScoreLog (or SqliteStore) for screens that show
+    # the best scores every frame. The top entries are loaded once, updated
+    # in place by record(), and reloaded only when the store's
+    # change_stamp() shows someone else wrote to it. The rendered score
+    # lines are cached too.
+    #
+    # With a BackgroundWriter the store is written on the writer thread;
+    # until that write lands the in-memory entries are the latest ones.
+
+    def __init__(self, log, writer=None):
+        self.log = log
+        self.writer = writer
+        self.entries = None
+        self.stamp = None
+        self.surfaces = None
+        self.surface_key = None
+
+    def top(self, count):
+        if self.writer and self.writer.busy():
+            if self.entries is not None:
+                return self.entries[:count]
+            # Nothing in memory yet; wait rather than read a half-written store
+            self.writer.flush()
+        stamp = self.log.change_stamp()
+        if self.entries is None or stamp != self.stamp:
+            self.entries = self.log.top()
+            self.stamp = stamp
+        return self.entries[:count]
+
+    def record(self, name, score, **details):
+        entry = {"name": name, "score": score}
+        entry.update(details)
+        if self.entries is not None:
+            self.entries = best(self.entries + [entry], self.log.top_k)
+        if self.writer:
+            # The store is reloaded once after the write, which is cheap and
+            # also picks up anything written meanwhile by someone else
+            self.writer.submit(self.log.append, entry)
+            return
+        self.log.append(entry)
+        # Our own write must not count as an outside change
+        self.stamp = self.log.change_stamp()
+
+    def render_lines(self, font, color, count):
+        # One surface per "name: score" row, re-rendered only when the top
+        # entries change
+        entries = self.top(count)
+        key = (font, color, tuple((e["name"], e["score"]) for e in entries))
+        if key != self.surface_key:
+            self.surfaces = [font.render(f"{e['name']}: {e['score']}", True, color) for e in entries]
+            self.surface_key = key
+        return self.surfaces
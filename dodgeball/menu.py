@@ -0,0 +1,253 @@
+import pygame
+
+from dodgeball.text import render_text
+
+# Blink period of the text cursor in an active TextInput, in milliseconds
+CURSOR_BLINK_MS = 500
+# Longest an idle menu sleeps before checking its widgets for outside
+# changes (a score saved by the background writer)
+IDLE_WAIT_MS = 1000
+
+
+class Widget:
+    # A retained menu element. Its look is rendered once into a cached
+    # surface and redrawn only after changed() (hover, typing, new text) or
+    # when the whole menu is invalidated.
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.surface = None
+        self.dirty = True
+        # Area covered on screen by the last draw, erased before a redraw
+        self.drawn = None
+
+    def changed(self):
+        self.surface = None
+        self.dirty = True
+
+    def render(self):
+        raise NotImplementedError
+
+    def draw(self, screen):
+        if self.surface is None:
+            self.surface = self.render()
+        self.dirty = False
+        self.drawn = screen.blit(self.surface, self.rect)
+        return self.drawn
+
+    def handle(self, event):
+        # Update state from an input event; call changed() if the look changes
+        pass
+
+    def tick(self, now):
+        # Update time-driven state (now is pygame.time.get_ticks())
+        pass
+
+    def wake_in(self, now):
+        # Milliseconds until tick() has something to do, or None
+        return None
+
+
+class Label(Widget):
+    # One line of text, positioned by a Rect keyword such as midtop=(x, y)
+
+    def __init__(self, font, text, color, **anchor):
+        self.font = font
+        self.color = color
+        self.anchor = anchor
+        self.text = text
+        super().__init__(render_text(font, text, color).get_rect(**anchor))
+
+    def set_text(self, text):
+        if text != self.text:
+            self.text = text
+            self.rect = render_text(self.font, text, self.color).get_rect(**self.anchor)
+            self.changed()
+
+    def render(self):
+        return render_text(self.font, self.text, self.color)
+
+
+class Button(Widget):
+    # Outlined box with a centered label; the outline thickens on hover
+
+    def __init__(self, font, text, color, rect):
+        super().__init__(rect)
+        self.font = font
+        self.text = text
+        self.color = color
+        self.hovered = False
+
+    def render(self):
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, self.color, surface.get_rect(), 3 if self.hovered else 2)
+        label = render_text(self.font, self.text, self.color)
+        surface.blit(label, label.get_rect(center=surface.get_rect().center))
+        return surface
+
+    def clicked(self, event):
+        return event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(event.pos)
+
+    def handle(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            hovered = self.rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.changed()
+
+
+class TextInput(Widget):
+    # Single-line text box that takes focus on click and shows a blinking
+    # cursor while active
+
+    def __init__(self, font, text, color, inactive_color, rect, max_length=20):
+        super().__init__(rect)
+        self.font = font
+        self.text = text
+        self.color = color
+        self.inactive_color = inactive_color
+        self.max_length = max_length
+        self.active = False
+        self.cursor_on = False
+
+    def render(self):
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, self.color if self.active else self.inactive_color,
+                         surface.get_rect(), 2)
+        text = render_text(self.font, self.text, self.color)
+        surface.blit(text, (10, 10))
+        if self.active and self.cursor_on:
+            x = 10 + text.get_width() + 2
+            pygame.draw.line(surface, self.color, (x, 8), (x, self.rect.height - 8), 2)
+        return surface
+
+    def handle(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            active = self.rect.collidepoint(event.pos)
+            if active != self.active:
+                self.active = active
+                self.cursor_on = active
+                self.changed()
+        elif event.type == pygame.KEYDOWN and self.active:
+            if event.key == pygame.K_RETURN:
+                self.active = False
+            elif event.key == pygame.K_BACKSPACE:
+                self.text = self.text[:-1]
+            elif len(self.text) < self.max_length:
+                self.text += event.unicode
+            self.changed()
+
+    def tick(self, now):
+        cursor_on = self.active and (now // CURSOR_BLINK_MS) % 2 == 0
+        if cursor_on != self.cursor_on:
+            self.cursor_on = cursor_on
+            self.changed()
+
+    def wake_in(self, now):
+        if self.active:
+            return CURSOR_BLINK_MS - now % CURSOR_BLINK_MS
+        return None
+
+
+class LineList(Widget):
+    # A column of centered text lines from lines(), a callable returning a
+    # list of surfaces (such as Leaderboard.render_lines). A new list object
+    # means the lines changed.
+
+    def __init__(self, lines, spacing, **anchor):
+        self.lines = lines
+        self.spacing = spacing
+        self.anchor = anchor
+        self.current = lines()
+        super().__init__(self.layout())
+
+    def layout(self):
+        if not self.current:
+            return pygame.Rect(0, 0, 0, 0)
+        width = max(line.get_width() for line in self.current)
+        height = self.spacing * (len(self.current) - 1) + self.current[-1].get_height()
+        rect = pygame.Rect(0, 0, width, height)
+        for name, value in self.anchor.items():
+            setattr(rect, name, value)
+        return rect
+
+    def render(self):
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        for i, line in enumerate(self.current):
+            surface.blit(line, ((self.rect.width - line.get_width()) // 2, i * self.spacing))
+        return surface
+
+    def tick(self, now):
+        current = self.lines()
+        if current is not self.current:
+            self.current = current
+            self.rect = self.layout()
+            self.changed()
+
+
+class Menu:
+    # Retained-mode screen: a list of widgets over a plain background. Only
+    # widgets that changed are redrawn and pushed to the display, and wait()
+    # sleeps in pygame.event.wait() until input arrives or a widget's timer
+    # (cursor blink) is due, so an idle menu uses next to no CPU.
+
+    def __init__(self, background, flip=None):
+        # flip shows a frame in place of pygame.display.flip(); with it
+        # (GpuScreen.present) every frame that changes is drawn in full
+        self.background = background
+        self.flip = flip
+        self.widgets = []
+        self.full = True
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        return widget
+
+    def invalidate(self):
+        # Redraw everything next time (resize, expose, returning from a
+        # screen drawn over this one)
+        self.full = True
+
+    def handle(self, event):
+        for widget in self.widgets:
+            widget.handle(event)
+
+    def draw(self, screen):
+        # Returns whether anything was pushed to the display
+        if self.flip and any(widget.dirty for widget in self.widgets):
+            self.full = True
+        if self.full:
+            screen.fill(self.background)
+            for widget in self.widgets:
+                widget.draw(screen)
+            if self.flip:
+                self.flip()
+            else:
+                pygame.display.flip()
+            self.full = False
+            return True
+        rects = []
+        for widget in self.widgets:
+            if widget.dirty:
+                if widget.drawn:
+                    rects.append(screen.fill(self.background, widget.drawn))
+                rects.append(widget.draw(screen))
+        if rects:
+            pygame.display.update(rects)
+        return bool(rects)
+
+    def wait(self, timeout=None):
+        # Block until there are events, a widget timer is due or timeout ms
+        # have passed; return the pending events (possibly none)
+        now = pygame.time.get_ticks()
+        timeout = IDLE_WAIT_MS if timeout is None else min(timeout, IDLE_WAIT_MS)
+        for widget in self.widgets:
+            due = widget.wake_in(now)
+            if due is not None:
+                timeout = min(timeout, due)
+        event = pygame.event.wait(max(1, timeout))
+        events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        now = pygame.time.get_ticks()
+        for widget in self.widgets:
+            widget.tick(now)
+        return events
@@ -0,0 +1,118 @@
+import numpy as np
+
+from dodgeball import config
+
+# Index <-> color/speed lookup for the color_index column
+COLORS = list(config.OBSTACLE_COLORS.keys())
+SPEEDS = np.array([config.OBSTACLE_COLORS[c] for c in COLORS], dtype=np.int32)
+
+# Shared empty result, so ticks where nothing happens allocate nothing
+NO_IDS = np.empty(0, dtype=np.int64)
+
+
+class ObstaclePool:
+    # Live obstacles kept as parallel arrays (structure of arrays) so that
+    # movement, culling and scoring are single vectorized operations.
+    # Rows [0, count) are live and stay in spawn order. Each obstacle also
+    # gets an id that never changes, so ids are sorted along the rows.
+    #
+    # The arrays only ever grow (doubling), and the per-tick tests write into
+    # two preallocated bool arrays, so once a session has reached its usual
+    # obstacle count a tick allocates no new arrays or Python objects
+    # beyond a few small views.
+
+    def __init__(self, capacity=64, width=config.obstacle_width, height=config.obstacle_height):
+        self.width = width
+        self.height = height
+        self.count = 0
+        self.next_id = 0
+        self.culled = NO_IDS
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        self.color_index = np.zeros(capacity, dtype=np.int8)
+        # y at which the broadphase has to re-bucket the obstacle
+        self.rebucket_y = np.zeros(capacity, dtype=np.int32)
+        # Scratch space for advance() and collision.obstacle_hits()
+        self.mask = np.zeros(capacity, dtype=bool)
+        self.scratch = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        capacity = len(self.x) * 2
+        for name in ("ids", "x", "y", "speed", "color_index", "rebucket_y"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.mask = np.zeros(capacity, dtype=bool)
+        self.scratch = np.zeros(capacity, dtype=bool)
+
+    def add(self, x, y, color_index):
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        self.ids[i] = self.next_id
+        self.next_id += 1
+        self.x[i] = x
+        self.y[i] = y
+        self.color_index[i] = color_index
+        self.speed[i] = SPEEDS[color_index]
+        self.count += 1
+        return self.ids[i]
+
+    def _keep(self, mask):
+        # Compact the live rows selected by mask to the front, preserving order
+        n = self.count
+        kept = int(mask.sum())
+        if kept == n:
+            return
+        for arr in (self.ids, self.x, self.y, self.speed, self.color_index, self.rebucket_y):
+            arr[:kept] = arr[:n][mask]
+        self.count = kept
+
+    def advance(self, screen_height):
+        # Move every obstacle down by its speed, drop the ones that left the
+        # screen and return the score earned for dodging them. The ids of
+        # the dropped obstacles are left in self.culled.
+        n = self.count
+        self.culled = NO_IDS
+        if n == 0:
+            return 0
+        y = self.y[:n]
+        y += self.speed[:n]
+        gone = np.greater(y, screen_height, out=self.mask[:n])
+        if not gone.any():
+            return 0
+        self.culled = self.ids[:n][gone]
+        earned = int(self.speed[:n][gone].sum())
+        self._keep(np.logical_not(gone, out=gone))
+        return earned
+
+    def remove_many(self, indices):
+        mask = np.ones(self.count, dtype=bool)
+        mask[indices] = False
+        self._keep(mask)
+
+    def rows_of(self, ids):
+        # Row of each id (ids must be live)
+        return np.searchsorted(self.ids[:self.count], ids)
+
+    def entries(self):
+        # (id, x, y, w, h) for every live obstacle
+        w, h = self.width, self.height
+        for i, x, y in zip(self.ids[:self.count].tolist(), self.x[:self.count].tolist(),
+                           self.y[:self.count].tolist()):
+            yield i, x, y, w, h
+
+    def positions(self, alpha=1.0):
+        # (x, y, color_index) of every obstacle, alpha of the way from the
+        # previous tick's position to the current one
+        n = self.count
+        ys = self.y[:n]
+        if alpha < 1.0:
+            ys = ys - ((1.0 - alpha) * self.speed[:n]).astype(np.int32)
+        return zip(self.x[:n].tolist(), ys.tolist(), self.color_index[:n].tolist())
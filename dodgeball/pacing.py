@@ -0,0 +1,58 @@
+import pygame
+
+from dodgeball import config
+
+# Refresh rate assumed when the display cannot report one
+DEFAULT_REFRESH_RATE = 60
+
+
+def display_refresh_rate():
+    # Refresh rate of the current display in Hz. Only some pygame builds
+    # (pygame-ce) can ask SDL for it; 0 or an error means unknown.
+    for name in ("get_current_refresh_rate", "get_desktop_refresh_rates"):
+        query = getattr(pygame.display, name, None)
+        if query is None:
+            continue
+        try:
+            rate = query()
+        except pygame.error:
+            continue
+        if isinstance(rate, (list, tuple)):
+            rate = rate[0] if rate else 0
+        if rate:
+            return rate
+    return DEFAULT_REFRESH_RATE
+
+
+class FramePacer:
+    # Frame-rate policy for battery-powered devices. While playing, frames
+    # are capped at the display refresh rate (or battery_saver_fps with the
+    # battery saver on). While idle (paused, in the background) the loop
+    # sleeps in pygame.event.wait() for up to 1/idle_fps s and wakes at once
+    # on input, so a paused game costs next to nothing.
+
+    def __init__(self, clock, battery_saver=config.battery_saver):
+        self.clock = clock
+        self.battery_saver = battery_saver
+        self.refresh_rate = None
+
+    def active_fps(self):
+        if self.battery_saver:
+            return config.battery_saver_fps
+        if self.refresh_rate is None:
+            self.refresh_rate = display_refresh_rate()
+        return min(self.refresh_rate, config.max_fps)
+
+    def display_changed(self):
+        # The window may have moved to a display with another refresh rate
+        self.refresh_rate = None
+
+    def wait(self, idle):
+        # End the frame; returns the milliseconds since the last one
+        if not idle:
+            return self.clock.tick(self.active_fps())
+        event = pygame.event.wait(1000 // config.idle_fps)
+        if event.type != pygame.NOEVENT:
+            # Leave it for the next frame's event loop
+            pygame.event.post(event)
+        return self.clock.tick()
@@ -0,0 +1,42 @@
+import os
+import sys
+
+
+class Profile:
+    # Everything that differs between builds of the game. The rules, menus,
+    # persistence and renderer are shared; a profile only picks:
+    #   touch_controls  on-screen D-pad driven by DpadTouch, on top of the
+    #                   keyboard
+    #   battery_pacing  FramePacer frame policy (refresh-rate cap, battery
+    #                   saver, sleeping while paused) instead of max_fps
+    #   smooth_scaling  smoothscale images instead of the cheaper scale
+    #   power_up_border draw the power-up with a thin white border
+
+    def __init__(self, name, touch_controls=False, battery_pacing=False, smooth_scaling=True,
+                 power_up_border=False):
+        self.name = name
+        self.touch_controls = touch_controls
+        self.battery_pacing = battery_pacing
+        self.smooth_scaling = smooth_scaling
+        self.power_up_border = power_up_border
+
+    def __repr__(self):
+        return f"Profile({self.name!r})"
+
+
+DESKTOP = Profile("desktop")
+ANDROID = Profile("android", touch_controls=True, battery_pacing=True, smooth_scaling=False,
+                  power_up_border=True)
+
+PROFILES = {profile.name: profile for profile in (DESKTOP, ANDROID)}
+
+
+def running_on_android():
+    # CPython 3.13+ has sys.getandroidapilevel(); python-for-android sets
+    # ANDROID_ARGUMENT
+    return hasattr(sys, "getandroidapilevel") or "ANDROID_ARGUMENT" in os.environ
+
+
+def detect():
+    # Profile for the platform we are running on
+    return ANDROID if running_on_android() else DESKTOP
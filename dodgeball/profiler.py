@@ -0,0 +1,150 @@
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+# Phases of one game frame, in the order they run. The simulation ones are
+# marked by World.step(), once per tick, and summed over the frame.
+PHASES = ("events", "spawn", "obstacles", "collision", "power_up", "audio",
+          "sprites", "hud", "hearts", "overlay", "present", "wait")
+
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    # Per-phase frame timings. mark(phase) charges the time since the
+    # previous mark to that phase; the last `window` frames are kept in a
+    # ring buffer for rolling percentiles. Every method returns immediately
+    # while the profiler is disabled.
+
+    def __init__(self, phases=PHASES, window=240):
+        self.phases = phases
+        self.index = {phase: i for i, phase in enumerate(phases)}
+        self.window = window
+        self.samples = np.zeros((window, len(phases)))
+        self.current = [0.0] * len(phases)
+        self.frames = 0
+        self.enabled = False
+        self.overlay = False
+        self.last = 0.0
+        self.csv_file = None
+        self.csv_writer = None
+        self.trace_file = None
+        self.trace = None
+        self.trace_start = 0.0
+        self.trace_empty = True
+        self.overlay_surface = None
+
+    def _update_enabled(self):
+        enabled = self.overlay or self.csv_writer is not None or self.trace is not None
+        if enabled and not self.enabled:
+            self.last = time.perf_counter()
+        self.enabled = enabled
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self.overlay_surface = None
+        self._update_enabled()
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.last = time.perf_counter()
+
+    def mark(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        i = self.index[phase]
+        self.current[i] += now - self.last
+        if self.trace is not None:
+            self.trace.append((i, self.last, now))
+        self.last = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.samples[self.frames % self.window] = self.current
+        if self.csv_writer is not None:
+            self.csv_writer.writerow([self.frames] + [f"{t * 1000:.4f}" for t in self.current])
+        if self.trace is not None:
+            self._write_trace()
+        self.current = [0.0] * len(self.phases)
+        self.frames += 1
+
+    def summary(self):
+        # {phase: (p50, p95, p99)} in milliseconds over the recent frames
+        n = min(self.frames, self.window)
+        if n == 0:
+            return {}
+        values = np.percentile(self.samples[:n] * 1000, PERCENTILES, axis=0)
+        return {phase: tuple(values[:, i].tolist()) for i, phase in enumerate(self.phases)}
+
+    # Capture to file
+
+    def start_csv(self, path):
+        self.csv_file = open(path, 'w', newline='')
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(["frame"] + [f"{phase}_ms" for phase in self.phases])
+        self._update_enabled()
+
+    def start_trace(self, path):
+        # Chrome trace format; open in chrome://tracing or Perfetto. Each
+        # frame's events are written out by end_frame(), so a long capture
+        # only ever holds one frame in memory.
+        self.trace_file = open(path, 'w')
+        self.trace_file.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+        self.trace = []
+        self.trace_start = time.perf_counter()
+        self.trace_empty = True
+        self._update_enabled()
+
+    def _write_trace(self):
+        if not self.trace:
+            return
+        start = self.trace_start
+        lines = ",\n".join(
+            json.dumps({"name": self.phases[i], "ph": "X", "pid": 0, "tid": 0,
+                        "ts": round((begin - start) * 1e6, 1), "dur": round((end - begin) * 1e6, 1)})
+            for i, begin, end in self.trace)
+        self.trace_file.write(lines if self.trace_empty else ",\n" + lines)
+        self.trace_empty = False
+        self.trace.clear()
+
+    def close(self):
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+        if self.trace is not None:
+            # Marks of an unfinished frame are kept too
+            self._write_trace()
+            self.trace_file.write("\n]}\n")
+            self.trace_file.close()
+            self.trace_file = None
+            self.trace = None
+        self._update_enabled()
+
+    # On-screen overlay
+
+    def draw(self, surface, font, color, pos=(10, 80), refresh=30):
+        # Blit the percentile table; it is re-rendered every `refresh` frames
+        if not self.overlay:
+            return None
+        if self.overlay_surface is None or self.frames % refresh == 0:
+            lines = [f"{'phase':<10} {'p50':>6} {'p95':>6} {'p99':>6} ms"]
+            for phase, (p50, p95, p99) in self.summary().items():
+                lines.append(f"{phase:<10} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+            rendered = [font.render(line, True, color) for line in lines]
+            height = sum(r.get_height() for r in rendered)
+            width = max(r.get_width() for r in rendered)
+            overlay = pygame.Surface((width + 8, height + 8))
+            overlay.set_alpha(200)
+            y = 4
+            for r in rendered:
+                overlay.blit(r, (4, y))
+                y += r.get_height()
+            self.overlay_surface = overlay
+        return surface.blit(self.overlay_surface, pos)
@@ -0,0 +1,51 @@
+import pygame
+
+
+class DirtyRects:
+    # Optional dirty-rectangle presenter. Instead of filling the whole screen
+    # and flipping every frame, only the areas drawn last frame are cleared
+    # and only those plus this frame's areas are pushed to the display.
+    # Disabled, or after invalidate(), it falls back to fill + flip.
+    # flip shows a frame in place of pygame.display.flip(); a screen without
+    # a persistent back buffer (GpuScreen.present) is always drawn in full.
+
+    def __init__(self, enabled=True, flip=None):
+        self.flip = flip
+        self.enabled = enabled and flip is None
+        self.previous = []
+        self.current = []
+        self.full = True
+
+    def invalidate(self):
+        # Redraw and push the whole screen next frame (resize, new screen)
+        self.full = True
+
+    def clear(self, surface, color):
+        if not self.enabled or self.full:
+            surface.fill(color)
+        else:
+            for rect in self.previous:
+                surface.fill(color, rect)
+
+    def add(self, rect):
+        # Record an area drawn this frame; pass the Rect returned by
+        # Surface.blit() or pygame.draw.*
+        if self.enabled:
+            self.current.append(rect)
+        return rect
+
+    def extend(self, rects):
+        # Record the list returned by Surface.blits()
+        if self.enabled and rects:
+            self.current.extend(rects)
+
+    def present(self):
+        if self.flip:
+            self.flip()
+        elif not self.enabled or self.full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.previous + self.current)
+        self.previous = self.current
+        self.current = []
+        self.full = False
@@ -0,0 +1,151 @@
+# Compact binary session replays: the World seed plus the input bitmask of
+# every tick, run-length encoded. Replaying runs the same World rules, so a
+# session comes out bit-exact and as fast as the simulation can go.
+#
+# Layout (little endian):
+#   header  b"DBRP", u8 version, u64 seed, u16 width, u16 height, u32 ticks
+#   records until end of data, each starting with a tag byte:
+#     0x00-0x0f  input bitmask held for a varint number of ticks
+#     0x80       window resize before the next tick: u16 width, u16 height
+#
+#   python -m dodgeball.replay last_replay.dbr
+
+import struct
+import sys
+import time
+
+from dodgeball.world import World
+
+MAGIC = b"DBRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQHHI")
+SIZE = struct.Struct("<HH")
+RESIZE = 0x80
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+
+    def __init__(self, seed, width, height):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.ticks = 0
+        # [inputs, run] lists and (RESIZE, width, height) tuples
+        self.records = []
+
+    def add_inputs(self, inputs):
+        records = self.records
+        if records and records[-1][0] == inputs:
+            records[-1][1] += 1
+        else:
+            records.append([inputs, 1])
+        self.ticks += 1
+
+    def add_resize(self, width, height):
+        self.records.append((RESIZE, width, height))
+
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.width, self.height, self.ticks))
+        for record in self.records:
+            if record[0] == RESIZE:
+                out.append(RESIZE)
+                out += SIZE.pack(record[1], record[2])
+            else:
+                out.append(record[0])
+                write_varint(out, record[1])
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, width, height, ticks = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a dodge ball replay (or an unsupported version)")
+        replay = cls(seed, width, height)
+        replay.ticks = ticks
+        pos = HEADER.size
+        while pos < len(data):
+            tag = data[pos]
+            pos += 1
+            if tag == RESIZE:
+                replay.records.append((RESIZE,) + SIZE.unpack_from(data, pos))
+                pos += SIZE.size
+            else:
+                run, pos = read_varint(data, pos)
+                replay.records.append([tag, run])
+        return replay
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def play(self, on_tick=None, **world_options):
+        # Re-run the session at full speed and return the final World.
+        # on_tick(world, events) is called after every tick.
+        world = World(self.width, self.height, seed=self.seed, **world_options)
+        for record in self.records:
+            if record[0] == RESIZE:
+                world.resize(record[1], record[2])
+                continue
+            inputs, run = record
+            for _ in range(run):
+                events = world.step(inputs)
+                if on_tick:
+                    on_tick(world, events)
+        return world
+
+
+class Recorder:
+    # Wraps a World and records everything that can change its outcome;
+    # use its step() and resize() in place of the World's
+
+    def __init__(self, world):
+        self.world = world
+        self.replay = Replay(world.seed, world.width, world.height)
+
+    def step(self, inputs=0):
+        self.replay.add_inputs(inputs)
+        return self.world.step(inputs)
+
+    def resize(self, width, height):
+        self.replay.add_resize(width, height)
+        self.world.resize(width, height)
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m dodgeball.replay REPLAY_FILE")
+    replay = Replay.load(sys.argv[1])
+    started = time.perf_counter()
+    world = replay.play()
+    elapsed = time.perf_counter() - started
+    print(f"seed {replay.seed}: {world.ticks} ticks, score {world.score}, level {world.level}, "
+          f"lives {world.lives}, game over {world.game_over}")
+    print(f"replayed in {elapsed * 1000:.1f} ms ({world.ticks / max(elapsed, 1e-9):.0f} ticks/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import heapq
+import json
+import os
+
+# Keep this many best entries in the sidecar index
+TOP_K = 10
+# Rewrite the log after this many appends
+COMPACT_EVERY = 500
+
+
+def write_atomic(path, text):
+    # Write to a temp file and rename it over path, so readers (and a crash)
+    # only ever see the old or the new contents, never a half-written file
+    tmp = path + ".tmp"
+    with open(tmp, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def parse_lines(lines):
+    entries = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # Torn write from a crash; dropped by the next compaction
+        if isinstance(entry, dict) and "score" in entry:
+            entries.append(entry)
+    return entries
+
+
+def best(entries, k):
+    return heapq.nlargest(k, entries, key=lambda e: e["score"])
+
+
+class ScoreLog:
+    # Append-only score history in JSON Lines, plus a small sidecar index
+    # holding the top-K entries. Saving a score appends one line and
+    # rewrites the K-entry index, so it costs the same however long the
+    # history is. The log is compacted (rewritten atomically without torn
+    # lines) every COMPACT_EVERY appends. A legacy scores.json array is
+    # migrated on first use.
+
+    def __init__(self, path, legacy_path=None, top_k=TOP_K):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.legacy_path = legacy_path
+        self.top_k = top_k
+
+    def _migrate(self):
+        if os.path.exists(self.path) or not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+        with open(self.legacy_path, 'r') as f:
+            entries = json.load(f)
+        write_atomic(self.path, "".join(json.dumps(e) + "\n" for e in entries))
+
+    def load(self):
+        # Every score ever saved, oldest first
+        self._migrate()
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'r') as f:
+            return parse_lines(f)
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # An index that does not describe the current log is stale (the log
+        # was written by someone else, or we crashed between the two writes)
+        if not os.path.exists(self.path) or index.get("log_size") != os.path.getsize(self.path):
+            return None
+        return index
+
+    def _rebuild_index(self, appends=0):
+        entries = self.load()
+        index = {
+            "log_size": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+            "count": len(entries),
+            "appends": appends,
+            "top": best(entries, self.top_k),
+        }
+        write_atomic(self.index_path, json.dumps(index))
+        return index
+
+    def top(self, k=None):
+        # The k best entries, highest score first, from the index
+        k = self.top_k if k is None else k
+        index = self._read_index()
+        if index is None or k > self.top_k:
+            index = self._rebuild_index()
+            if k > self.top_k:
+                return best(self.load(), k)
+        return index["top"][:k]
+
+    def append(self, entry):
+        self._migrate()
+        index = self._read_index()
+        if index is None:
+            index = self._rebuild_index()
+
+        line = json.dumps(entry) + "\n"
+        with open(self.path, 'a+b') as f:
+            # Never glue a new entry onto a torn last line
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode())
+            f.flush()
+            os.fsync(f.fileno())
+
+        index["appends"] += 1
+        if index["appends"] >= COMPACT_EVERY:
+            self.compact()
+            return
+        index["count"] += 1
+        index["top"] = best(index["top"] + [entry], self.top_k)
+        index["log_size"] = os.path.getsize(self.path)
+        write_atomic(self.index_path, json.dumps(index))
+
+    def change_stamp(self):
+        # Changes whenever the log file is written
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def compact(self):
+        entries = self.load()
+        write_atomic(self.path, "".join(json.dumps(e) + "\n" for e in entries))
+        self._rebuild_index()
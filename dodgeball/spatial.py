@@ -0,0 +1,100 @@
+import numpy as np
+
+from dodgeball import config
+
+# Grid resolution; cell size follows the window so the grid always covers
+# the screen with the same number of cells
+GRID_COLS = 16
+GRID_ROWS = 12
+
+
+class SpatialHash:
+    # Uniform-grid broadphase. Every entry is bucketed into each screen cell
+    # its rect covers, so a query only has to look at the cells under the
+    # queried rect. Keys are any hashable (the World uses obstacle ids).
+
+    def __init__(self, width=config.WIDTH, height=config.HEIGHT):
+        self.cells = {}
+        self.spans = {}
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        self.cell_w = max(1, -(-width // GRID_COLS))
+        self.cell_h = max(1, -(-height // GRID_ROWS))
+
+    def span(self, x, y, w, h):
+        return (x // self.cell_w, (x + w - 1) // self.cell_w,
+                y // self.cell_h, (y + h - 1) // self.cell_h)
+
+    def next_row_y(self, y, h):
+        # Smallest top edge at which a rect of height h, falling from y,
+        # covers a different set of grid rows. Works on NumPy arrays too.
+        ch = self.cell_h
+        top = (y // ch + 1) * ch
+        bottom = ((y + h - 1) // ch + 1) * ch - h + 1
+        return np.minimum(top, bottom)
+
+    def _add(self, key, span):
+        x0, x1, y0, y1 = span
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {key}
+                else:
+                    bucket.add(key)
+
+    def _discard(self, key, span):
+        x0, x1, y0, y1 = span
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells[(cx, cy)]
+                bucket.discard(key)
+                if not bucket:
+                    del cells[(cx, cy)]
+
+    def insert(self, key, x, y, w, h):
+        span = self.span(x, y, w, h)
+        self.spans[key] = span
+        self._add(key, span)
+
+    def move(self, key, x, y, w, h):
+        # Only touches the buckets when the entry crosses a cell boundary
+        span = self.span(x, y, w, h)
+        old = self.spans[key]
+        if span != old:
+            self._discard(key, old)
+            self._add(key, span)
+            self.spans[key] = span
+
+    def remove(self, key):
+        span = self.spans.pop(key, None)
+        if span is not None:
+            self._discard(key, span)
+
+    def clear(self):
+        self.cells.clear()
+        self.spans.clear()
+
+    def rebuild(self, width, height, entries):
+        # Re-bucket everything for a new window size; entries yields
+        # (key, x, y, w, h)
+        self.clear()
+        self.resize(width, height)
+        for key, x, y, w, h in entries:
+            self.insert(key, x, y, w, h)
+
+    def query(self, rect):
+        # Keys of every entry sharing a cell with rect (a superset of the
+        # entries that actually overlap it)
+        x0, x1, y0, y1 = self.span(rect.x, rect.y, rect.width, rect.height)
+        cells = self.cells
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
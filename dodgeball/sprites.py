@@ -0,0 +1,102 @@
+import pygame
+
+from dodgeball import config
+from dodgeball.obstacles import COLORS
+
+# Transparent margin around the D-pad so its outline is not clipped
+DPAD_MARGIN = 2
+
+
+def dpad_arrows(cx, cy, arrow_size):
+    # Up, left, right and down arrow triangles around (cx, cy)
+    half = arrow_size // 2
+    return [
+        [(cx, cy - arrow_size), (cx - half, cy), (cx + half, cy)],
+        [(cx - arrow_size, cy), (cx, cy - half), (cx, cy + half)],
+        [(cx + arrow_size, cy), (cx, cy - half), (cx, cy + half)],
+        [(cx, cy + arrow_size), (cx - half, cy), (cx + half, cy)],
+    ]
+
+
+def display_format(surface, alpha=False):
+    # Convert to the display's pixel format for fast blits; without a
+    # display surface (GpuScreen, headless tools) keep it as is
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+class SpriteCache:
+    # Obstacles, the power-up, the ball and the D-pad pre-rendered once into
+    # display-format surfaces, so a frame is a single Surface.blits() batch
+    # instead of a pygame.draw call (or two) per object. Surfaces are built
+    # on first use, after the display mode is set; call invalidate() when it
+    # changes (resize) or when colors change.
+
+    def __init__(self, power_up_border=False):
+        self.power_up_border = power_up_border
+        self.built = False
+        self.dpads = {}
+
+    def invalidate(self):
+        self.built = False
+        self.dpads.clear()
+
+    def build(self):
+        w, h = config.obstacle_width, config.obstacle_height
+        self.obstacles = []
+        for color in COLORS:
+            sprite = pygame.Surface((w, h))
+            sprite.fill(color)
+            pygame.draw.rect(sprite, config.WHITE, sprite.get_rect(), 1)
+            self.obstacles.append(display_format(sprite))
+
+        power_up = pygame.Surface((config.power_up_width, config.power_up_height))
+        power_up.fill(config.power_up_color)
+        if self.power_up_border:
+            pygame.draw.rect(power_up, config.WHITE, power_up.get_rect(), 1)
+        self.power_up = display_format(power_up)
+
+        r = config.ball_radius
+        ball = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+        pygame.draw.circle(ball, config.RED, (r, r), r)
+        self.ball = display_format(ball, alpha=True)
+        self.built = True
+
+    def _check(self):
+        if not self.built:
+            self.build()
+
+    def obstacle_blits(self, obstacles, alpha=1.0):
+        # Blit sequence for every obstacle in an ObstaclePool
+        self._check()
+        sprites = self.obstacles
+        return [(sprites[c], (x, y)) for x, y, c in obstacles.positions(alpha)]
+
+    def power_up_blit(self, rect):
+        self._check()
+        return self.power_up, (rect[0], rect[1])
+
+    def ball_blit(self, center):
+        self._check()
+        r = config.ball_radius
+        return self.ball, (center[0] - r, center[1] - r)
+
+    def dpad(self, arrow_size, fill, outline):
+        # The whole four-arrow D-pad as one surface, centered at
+        # (arrow_size + DPAD_MARGIN, arrow_size + DPAD_MARGIN)
+        key = (arrow_size, fill, outline)
+        sprite = self.dpads.get(key)
+        if sprite is None:
+            c = arrow_size + DPAD_MARGIN
+            sprite = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+            for arrow in dpad_arrows(c, c, arrow_size):
+                pygame.draw.polygon(sprite, fill, arrow)
+                pygame.draw.polygon(sprite, outline, arrow, width=2)
+            sprite = display_format(sprite, alpha=True)
+            self.dpads[key] = sprite
+        return sprite
+
+    def dpad_blit(self, center, arrow_size, fill, outline):
+        c = arrow_size + DPAD_MARGIN
+        return self.dpad(arrow_size, fill, outline), (center[0] - c, center[1] - c)
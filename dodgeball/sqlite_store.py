@@ -0,0 +1,168 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from dodgeball.scores import TOP_K, parse_lines
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER,
+    duration REAL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_by_player ON scores (name, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_time ON scores (played_at DESC);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+SCORE_COLUMNS = ("name", "score", "level", "duration", "played_at")
+
+
+def row_to_entry(row):
+    entry = {"name": row[0], "score": row[1]}
+    for column, value in zip(SCORE_COLUMNS[2:], row[2:]):
+        if value is not None:
+            entry[column] = value
+    return entry
+
+
+class SqliteStore:
+    # Optional SQLite backend for scores and settings. It offers the same
+    # load()/append()/top() interface as ScoreLog (so Leaderboard works on
+    # either) plus per-player and recent-game queries. The database runs in
+    # WAL mode, so a write never blocks readers. Each thread gets its own
+    # connection. On first open, the existing JSON scores (scores.jsonl, or
+    # a legacy scores.json without one) and settings are imported once.
+
+    def __init__(self, path, scores_files=(), settings_file=None, top_k=TOP_K):
+        self.path = path
+        self.scores_files = scores_files
+        self.settings_file = settings_file
+        self.top_k = top_k
+        self.local = threading.local()
+        self.migrate_lock = threading.Lock()
+
+    def connection(self):
+        db = getattr(self.local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SCHEMA)
+            self.local.db = db
+            with self.migrate_lock:
+                self._migrate(db)
+        return db
+
+    def close(self):
+        db = getattr(self.local, "db", None)
+        if db is not None:
+            db.close()
+            self.local.db = None
+
+    # One-shot import of the JSON files
+
+    def _migrate(self, db):
+        if db.execute("SELECT 1 FROM meta WHERE key = 'migrated'").fetchone():
+            return
+        # scores_files is newest format first. Only the first one found is
+        # imported: ScoreLog keeps scores.json after copying it into
+        # scores.jsonl, so the older files hold the same scores again.
+        entries = []
+        for path in self.scores_files:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r') as f:
+                if path.endswith(".jsonl"):
+                    entries = parse_lines(f)
+                else:
+                    entries = json.load(f)
+            break
+        settings = {}
+        if self.settings_file and os.path.exists(self.settings_file):
+            with open(self.settings_file, 'r') as f:
+                settings = json.load(f)
+        with db:
+            # Old entries have no timestamp; keep their order with 0, 1, 2...
+            db.executemany(
+                "INSERT INTO scores (name, score, level, duration, played_at) VALUES (?, ?, ?, ?, ?)",
+                [(e["name"], e["score"], e.get("level"), e.get("duration"), e.get("played_at", i))
+                 for i, e in enumerate(entries)])
+            db.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                           [(k, json.dumps(v)) for k, v in settings.items()])
+            db.execute("INSERT INTO meta (key, value) VALUES ('migrated', ?)", (str(time.time()),))
+
+    # Scores
+
+    def load(self):
+        rows = self.connection().execute(
+            "SELECT name, score, level, duration, played_at FROM scores ORDER BY id")
+        return [row_to_entry(row) for row in rows]
+
+    def append(self, entry):
+        db = self.connection()
+        with db:
+            db.execute(
+                "INSERT INTO scores (name, score, level, duration, played_at) VALUES (?, ?, ?, ?, ?)",
+                (entry["name"], entry["score"], entry.get("level"), entry.get("duration"),
+                 entry.get("played_at", time.time())))
+
+    def top(self, k=None):
+        k = self.top_k if k is None else k
+        rows = self.connection().execute(
+            "SELECT name, score, level, duration, played_at FROM scores "
+            "ORDER BY score DESC, id LIMIT ?", (k,))
+        return [row_to_entry(row) for row in rows]
+
+    def player_bests(self, limit=10):
+        # Best score of each player, best players first (ties by name)
+        rows = self.connection().execute(
+            "SELECT name, MAX(score) AS best FROM scores GROUP BY name ORDER BY best DESC, name "
+            "LIMIT ?",
+            (limit,))
+        return [{"name": name, "score": best} for name, best in rows]
+
+    def player_top(self, name, limit=10):
+        # One player's best games; equal scores in the order they were played
+        rows = self.connection().execute(
+            "SELECT name, score, level, duration, played_at FROM scores WHERE name = ? "
+            "ORDER BY score DESC, id LIMIT ?", (name, limit))
+        return [row_to_entry(row) for row in rows]
+
+    def recent(self, limit=10):
+        # Latest games first
+        rows = self.connection().execute(
+            "SELECT name, score, level, duration, played_at FROM scores "
+            "ORDER BY played_at DESC, id DESC LIMIT ?", (limit,))
+        return [row_to_entry(row) for row in rows]
+
+    def change_stamp(self):
+        # Changes whenever another connection commits to the database
+        return self.connection().execute("PRAGMA data_version").fetchone()[0]
+
+    # Settings
+
+    def load_settings(self, defaults):
+        settings = dict(defaults)
+        for key, value in self.connection().execute("SELECT key, value FROM settings"):
+            settings[key] = json.loads(value)
+        return settings
+
+    def save_settings(self, settings):
+        db = self.connection()
+        with db:
+            db.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                           [(k, json.dumps(v)) for k, v in settings.items()])
@@ -0,0 +1,57 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    # LRU cache of rendered text surfaces keyed by (font, text, color,
+    # antialias). Font rasterization is expensive and most labels never change.
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, color, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared cache used by render_text()
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    return text_cache.render(font, text, color, antialias)
+
+
+class HudText:
+    # A HUD label such as "Score: {}" that is only re-rendered when the
+    # value shown in it changes. Changing values (the score) would just
+    # churn the shared LRU, so each label keeps its own last surface.
+
+    def __init__(self, font, template, color, antialias=True):
+        self.font = font
+        self.template = template
+        self.color = color
+        self.antialias = antialias
+        self.value = None
+        self.surface = None
+
+    def render(self, value):
+        if self.surface is None or value != self.value:
+            self.value = value
+            self.surface = self.font.render(self.template.format(value), self.antialias, self.color)
+        return self.surface
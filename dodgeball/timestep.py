@@ -0,0 +1,31 @@
+from dodgeball import config
+
+
+class FixedTimestep:
+    # Accumulator that turns variable frame times into a whole number of
+    # fixed simulation ticks. Feed it the clock.tick() delta every frame;
+    # alpha is how far the renderer is between the last two ticks.
+
+    def __init__(self, tick_rate=config.TICK_RATE, max_catch_up=config.max_catch_up_ticks):
+        self.tick_ms = 1000.0 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.accumulator = 0.0
+
+    def advance(self, dt_ms):
+        # Number of ticks to run for a frame that took dt_ms. After a long
+        # hitch at most max_catch_up ticks are run and the rest is dropped.
+        self.accumulator += dt_ms
+        steps = int(self.accumulator // self.tick_ms)
+        if steps > self.max_catch_up:
+            steps = self.max_catch_up
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.tick_ms
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.tick_ms
+
+    def reset(self):
+        self.accumulator = 0.0
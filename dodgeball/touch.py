@@ -0,0 +1,105 @@
+import pygame
+
+from dodgeball.world import LEFT, RIGHT, UP, DOWN
+
+# Pointer key of the (non-touch) mouse in DpadTouch.pointers
+MOUSE = "mouse"
+
+
+def dpad_regions(cx, cy, arrow_size):
+    # Hit box of each D-pad arrow, in priority order where they overlap
+    half = arrow_size // 2
+    return [
+        (pygame.Rect(cx - half, cy - arrow_size, arrow_size, arrow_size), UP),
+        (pygame.Rect(cx - arrow_size, cy - half, arrow_size, arrow_size), LEFT),
+        (pygame.Rect(cx, cy - half, arrow_size, arrow_size), RIGHT),
+        (pygame.Rect(cx - half, cy, arrow_size, arrow_size), DOWN),
+    ]
+
+
+class DpadTouch:
+    # Held D-pad directions from any number of fingers (and the mouse).
+    # Each pointer is tracked from FINGERDOWN through FINGERMOTION to
+    # FINGERUP, so a direction stays held for as long as a finger rests on
+    # it, and held is the input bitmask of everything pressed right now.
+    # Which arrow a point is on comes from a table precomputed per layout,
+    # one byte per pixel of the D-pad's bounding square.
+
+    def __init__(self):
+        self.pointers = {}
+        self.held = 0
+        self.window_size = (1, 1)
+        self.left = self.top = self.side = 0
+        self.table = b""
+
+    def layout(self, center, arrow_size, window_size):
+        # Call again whenever the D-pad moves or the window is resized
+        cx, cy = center
+        self.window_size = window_size
+        self.left = cx - arrow_size
+        self.top = cy - arrow_size
+        self.side = side = arrow_size * 2
+        table = bytearray(side * side)
+        # Paint lowest priority first so earlier regions win the overlaps
+        for rect, direction in reversed(dpad_regions(cx, cy, arrow_size)):
+            rect = rect.clip(self.left, self.top, side, side)
+            run = bytes([direction]) * rect.width
+            for y in range(rect.top - self.top, rect.bottom - self.top):
+                start = y * side + rect.left - self.left
+                table[start:start + rect.width] = run
+        self.table = bytes(table)
+        # Re-resolve pointers that are down across the change
+        self.pointers = dict.fromkeys(self.pointers, 0)
+        self.held = 0
+
+    def direction_at(self, x, y):
+        x -= self.left
+        y -= self.top
+        if 0 <= x < self.side and 0 <= y < self.side:
+            return self.table[y * self.side + x]
+        return 0
+
+    def press(self, key, x, y):
+        self.pointers[key] = self.direction_at(x, y)
+        self._update()
+
+    def release(self, key):
+        if self.pointers.pop(key, None) is not None:
+            self._update()
+
+    def release_all(self):
+        self.pointers.clear()
+        self.held = 0
+
+    def _update(self):
+        held = 0
+        for direction in self.pointers.values():
+            held |= direction
+        self.held = held
+
+    def handle(self, event):
+        # Feed every event; returns True if it was pointer input
+        kind = event.type
+        if kind in (pygame.FINGERDOWN, pygame.FINGERMOTION):
+            # Finger positions are normalized to the window
+            w, h = self.window_size
+            key = (event.touch_id, event.finger_id)
+            if kind == pygame.FINGERDOWN or key in self.pointers:
+                self.press(key, int(event.x * w), int(event.y * h))
+            return True
+        if kind == pygame.FINGERUP:
+            self.release((event.touch_id, event.finger_id))
+            return True
+        # Mouse events that SDL synthesizes from touches are already
+        # handled as fingers
+        if kind in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP):
+            if getattr(event, "touch", False):
+                return True
+            if kind == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self.press(MOUSE, *event.pos)
+            elif kind == pygame.MOUSEMOTION and MOUSE in self.pointers:
+                self.press(MOUSE, *event.pos)
+            elif kind == pygame.MOUSEBUTTONUP and event.button == 1:
+                self.release(MOUSE)
+            return True
+        return False
@@ -0,0 +1,245 @@
+import random
+
+import numpy as np
+
+import pygame
+
+from dodgeball import config
+from dodgeball.collision import obstacle_hits
+from dodgeball.obstacles import ObstaclePool, COLORS
+from dodgeball.spatial import SpatialHash
+
+# Input bitmask for World.step()
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+
+# Events returned from World.step()
+COLLISION = "collision"
+POWER_UP = "power_up"
+GAME_OVER = "game_over"
+
+
+class World:
+    # One game session: the spawn/move/collide/score rules of game_loop()
+    # without any display, audio or frame cap. Call step() once per tick.
+    #
+    # With broadphase=True obstacles are also kept in a SpatialHash and only
+    # the ones in the cells under the ball are narrow-phase tested. The
+    # single power-up is always tested directly.
+    # For a single ball the one-pass vectorized test is cheaper, so it is off
+    # by default; it pays off once several rects are tested per tick.
+
+    def __init__(self, width=config.WIDTH, height=config.HEIGHT, broadphase=False, seed=None):
+        # Every random decision comes from this session's own generator, so
+        # the seed plus the per-tick inputs reproduce a session exactly
+        if seed is None:
+            seed = random.randrange(2 ** 64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.width = width
+        self.height = height
+        self.ball_x = width // 2
+        self.ball_y = height - 50
+        self.prev_ball_x = self.ball_x
+        self.prev_ball_y = self.ball_y
+        self.obstacles = ObstaclePool()
+        # The ball's hitbox, the single power-up slot and the event list are
+        # made once and reused every tick
+        r = config.ball_radius
+        self.ball_hitbox = pygame.Rect(0, 0, r * 2, r * 2)
+        self.power_up_slot = pygame.Rect(0, 0, config.power_up_width, config.power_up_height)
+        self.events = []
+        self.score = 0
+        self.level = 1
+        self.level_timer = 0
+        self.power_up = None
+        self.ball_speed_boost_remaining = 0
+        self.lives = config.starting_lives
+        self.ticks = 0
+        self.game_over = False
+        self.grid = SpatialHash(width, height) if broadphase else None
+        # Optional FrameProfiler; step() marks its phases on it
+        self.profiler = None
+
+    def resize(self, width, height):
+        # Pull the ball, obstacles and power-up back inside a smaller window
+        self.width = width
+        self.height = height
+        r = config.ball_radius
+        self.ball_x = min(self.ball_x, width - r)
+        self.ball_y = min(self.ball_y, height - r)
+        self.prev_ball_x = min(self.prev_ball_x, width - r)
+        self.prev_ball_y = min(self.prev_ball_y, height - r)
+        n = self.obstacles.count
+        np.minimum(self.obstacles.x[:n], width - self.obstacles.width, out=self.obstacles.x[:n])
+        if self.power_up:
+            self.power_up.x = min(self.power_up.x, width - self.power_up.width)
+        if self.grid:
+            self.grid.rebuild(width, height, self.obstacles.entries())
+            self.obstacles.rebucket_y[:n] = self.grid.next_row_y(self.obstacles.y[:n],
+                                                                 self.obstacles.height)
+
+    def ball_pos(self, alpha=1.0):
+        # Ball center interpolated between the previous and the current tick
+        x = self.prev_ball_x + (self.ball_x - self.prev_ball_x) * alpha
+        y = self.prev_ball_y + (self.ball_y - self.prev_ball_y) * alpha
+        return int(x), int(y)
+
+    def power_up_rect(self, alpha=1.0):
+        p = self.power_up
+        return (p.x, p.y - int((1 - alpha) * config.power_up_speed), p.width, p.height)
+
+    def ball_rect(self):
+        # Updated in place; valid until the ball moves again
+        r = config.ball_radius
+        rect = self.ball_hitbox
+        rect.x = self.ball_x - r
+        rect.y = self.ball_y - r
+        return rect
+
+    def spawn_obstacle(self):
+        x = self.rng.randint(0, self.width - config.obstacle_width)
+        y = -config.obstacle_height
+        key = self.obstacles.add(x, y, self.rng.randrange(len(COLORS)))
+        if self.grid:
+            h = config.obstacle_height
+            self.grid.insert(int(key), x, y, config.obstacle_width, h)
+            self.obstacles.rebucket_y[self.obstacles.count - 1] = self.grid.next_row_y(y, h)
+
+    def spawn_power_up(self):
+        x = self.rng.randint(0, self.width - config.power_up_width)
+        y = -config.power_up_height
+        self.power_up = self.power_up_slot
+        self.power_up.x = x
+        self.power_up.y = y
+
+    def rebucket_fallen(self):
+        # Obstacles only move down, so after advance() just the ones that
+        # reached their rebucket_y have crossed into a new grid row
+        obstacles = self.obstacles
+        for key in obstacles.culled.tolist():
+            self.grid.remove(key)
+        n = obstacles.count
+        if n == 0:
+            return
+        w, h = obstacles.width, obstacles.height
+        for row in np.flatnonzero(obstacles.y[:n] >= obstacles.rebucket_y[:n]).tolist():
+            x = int(obstacles.x[row])
+            y = int(obstacles.y[row])
+            self.grid.move(int(obstacles.ids[row]), x, y, w, h)
+            obstacles.rebucket_y[row] = self.grid.next_row_y(y, h)
+
+    def obstacle_hits(self, rect):
+        # Rows of the obstacles overlapping rect, in spawn order
+        if not self.grid:
+            return obstacle_hits(rect, self.obstacles)
+        candidates = self.grid.query(rect)
+        if not candidates:
+            return ()
+        rows = self.obstacles.rows_of(np.array(sorted(candidates)))
+        return obstacle_hits(rect, self.obstacles, rows)
+
+    def move_ball(self, inputs):
+        r = config.ball_radius
+        if self.ball_speed_boost_remaining > 0:
+            speed = config.ball_speed_boost
+        else:
+            speed = config.ball_speed
+
+        if inputs & LEFT and self.ball_x - r > 0:
+            self.ball_x -= speed
+        if inputs & RIGHT and self.ball_x + r < self.width:
+            self.ball_x += speed
+        if inputs & UP and self.ball_y - r > 0:
+            self.ball_y -= speed
+        if inputs & DOWN and self.ball_y + r < self.height:
+            self.ball_y += speed
+
+    def step(self, inputs=0):
+        # Advance the simulation by one tick and return the list of
+        # events (COLLISION, POWER_UP, GAME_OVER) that happened during it.
+        # The same list is reused by the next step().
+        events = self.events
+        events.clear()
+        if self.game_over:
+            return events
+        self.ticks += 1
+        prof = self.profiler
+
+        self.prev_ball_x = self.ball_x
+        self.prev_ball_y = self.ball_y
+        self.move_ball(inputs)
+
+        # Add new obstacles
+        if self.rng.randint(1, config.obstacle_spawn_chance) == 1:
+            self.spawn_obstacle()
+
+        # Add new power-up
+        if self.power_up is None and self.rng.randint(1, config.power_up_spawn_chance) == 1:
+            self.spawn_power_up()
+        if prof:
+            prof.mark("spawn")
+
+        # Update obstacles
+        self.score += self.obstacles.advance(self.height)
+        if self.grid:
+            self.rebucket_fallen()
+        if prof:
+            prof.mark("obstacles")
+
+        # Collision detection
+        ball_rect = self.ball_rect()
+
+        hits = self.obstacle_hits(ball_rect)
+        if len(hits):
+            # Hits are handled in spawn order; once the last life is gone the
+            # remaining hits are left alone, as the per-obstacle loop did
+            taken = hits[:self.lives]
+            events.extend([COLLISION] * len(taken))
+            self.lives -= len(taken)
+            if self.grid:
+                for key in self.obstacles.ids[taken].tolist():
+                    self.grid.remove(key)
+            self.obstacles.remove_many(taken)
+            if self.lives <= 0:
+                self.game_over = True
+                events.append(GAME_OVER)
+                return events
+        if prof:
+            prof.mark("collision")
+
+        # Handle power-up
+        if self.power_up:
+            p = self.power_up
+            p.y += config.power_up_speed
+            if p.y > self.height:
+                self.power_up = None
+            elif ball_rect.colliderect(p):
+                events.append(POWER_UP)
+                self.power_up = None
+                self.ball_speed_boost_remaining = config.ball_speed_boost_duration
+
+        # Update level
+        self.level_timer += 1
+        if self.level_timer >= config.level_duration:
+            self.level += 1
+            self.level_timer = 0
+
+        if self.ball_speed_boost_remaining > 0:
+            self.ball_speed_boost_remaining -= 1
+        if prof:
+            prof.mark("power_up")
+
+        return events
+
+
+def run_session(policy=None, max_ticks=100000, width=config.WIDTH, height=config.HEIGHT,
+                broadphase=False, seed=None):
+    # Play one session as fast as possible. policy(world) returns the input
+    # bitmask for the next tick; without one the ball just stands still.
+    world = World(width, height, broadphase, seed)
+    while not world.game_over and world.ticks < max_ticks:
+        world.step(policy(world) if policy else 0)
+    return world
@@ -0,0 +1,53 @@
+import queue
+import sys
+import threading
+
+
+class BackgroundWriter:
+    # Runs persistence jobs (score appends, settings and replay saves) on one
+    # daemon thread, in the order they were submitted, so the frame never
+    # waits on the disk. A job submitted with a key replaces a queued job with
+    # the same key that has not started yet, so saving the settings twice in
+    # a row writes them once. flush() blocks until everything queued is on
+    # disk; call it before exiting.
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def submit(self, job, *args, key=None):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="writer", daemon=True)
+                self.thread.start()
+            if key is not None:
+                queued = key in self.pending
+                self.pending[key] = (job, args)
+                if queued:
+                    return
+            self.queue.put((key, job, args))
+
+    def busy(self):
+        # True while a submitted job has not finished
+        return self.queue.unfinished_tasks > 0
+
+    def flush(self):
+        if self.thread is not None:
+            self.queue.join()
+
+    def _run(self):
+        while True:
+            key, job, args = self.queue.get()
+            if key is not None:
+                # Run the latest job submitted under this key
+                with self.lock:
+                    job, args = self.pending.pop(key)
+            try:
+                job(*args)
+            except Exception as e:
+                # Losing one save must not stop the ones after it
+                print(f"Background write failed: {e!r}", file=sys.stderr)
+            finally:
+                self.queue.task_done()
@@ -0,0 +1,24 @@
+import random
+
+import numpy as np
+import pygame
+
+from dodgeball.collision import aabb_hits
+
+WIDTH, HEIGHT = 50, 20
+
+
+def test_aabb_hits_matches_colliderect():
+    rng = random.Random(3)
+    for _ in range(200):
+        count = rng.randrange(0, 60)
+        # A small area so that edge-touching boxes come up often
+        xs = np.array([rng.randrange(-60, 200) for _ in range(count)], dtype=np.int32)
+        ys = np.array([rng.randrange(-30, 120) for _ in range(count)], dtype=np.int32)
+        rect = pygame.Rect(rng.randrange(0, 150), rng.randrange(0, 90),
+                           rng.randrange(1, 60), rng.randrange(1, 40))
+        expected = rect.collidelistall([(x, y, WIDTH, HEIGHT) for x, y in zip(xs.tolist(), ys.tolist())])
+
+        assert aabb_hits(rect, xs, ys, WIDTH, HEIGHT).tolist() == expected
+        out = (np.zeros(count, dtype=bool), np.zeros(count, dtype=bool))
+        assert aabb_hits(rect, xs, ys, WIDTH, HEIGHT, out).tolist() == expected
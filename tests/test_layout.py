@@ -0,0 +1,33 @@
+import pygame
+
+from dodgeball.layout import ResizeDebouncer, layout_for
+
+
+class Resize:
+    def __init__(self, w, h):
+        self.w = w
+        self.h = h
+
+
+def test_resize_reported_once_settled(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: now[0])
+    resizes = ResizeDebouncer(settle_ms=150)
+    assert resizes.poll() is None
+    assert resizes.wake_in() is None
+
+    resizes.push(Resize(700, 500))
+    now[0] += 100
+    resizes.push(Resize(640, 480))  # still dragging: the wait starts over
+    now[0] += 100
+    assert resizes.poll() is None
+    assert resizes.wake_in() == 50
+    now[0] += 50
+    assert resizes.poll() == (640, 480)
+    assert resizes.poll() is None
+
+
+def test_layout_is_computed_once_per_size():
+    assert layout_for(640, 480) is layout_for(640, 480)
+    assert layout_for(640, 480).size == (640, 480)
+    assert layout_for(800, 600).dpad_center == (100, 500)
@@ -0,0 +1,24 @@
+import json
+
+from dodgeball.profiler import FrameProfiler
+
+
+def test_trace_is_streamed_frame_by_frame(tmp_path):
+    path = str(tmp_path / "trace.json")
+    profiler = FrameProfiler()
+    profiler.start_trace(path)
+    for _ in range(50):
+        profiler.begin_frame()
+        profiler.mark("events")
+        profiler.mark("present")
+        profiler.end_frame()
+        assert profiler.trace == []
+    profiler.begin_frame()
+    profiler.mark("events")
+    profiler.close()
+
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    assert len(events) == 101
+    assert [e["name"] for e in events[:3]] == ["events", "present", "events"]
+    assert not profiler.enabled
@@ -0,0 +1,32 @@
+from dodgeball import World
+from dodgeball.replay import Recorder, Replay
+
+from tests.test_world import RESIZES, policy, state
+
+
+def record(seed, max_ticks=3000):
+    recorder = Recorder(World(seed=seed))
+    world = recorder.world
+    while not world.game_over and world.ticks < max_ticks:
+        if world.ticks in RESIZES:
+            recorder.resize(*RESIZES[world.ticks])
+        recorder.step(policy(world.ticks))
+    return recorder
+
+
+def test_replay_round_trip_is_bit_exact():
+    for seed in (0, 7, 2 ** 64 - 1):
+        recorder = record(seed)
+        data = recorder.replay.to_bytes()
+        replay = Replay.from_bytes(data)
+        assert replay.to_bytes() == data
+        assert replay.ticks == recorder.world.ticks
+        assert state(replay.play()) == state(recorder.world)
+
+
+def test_replay_rejects_other_files():
+    try:
+        Replay.from_bytes(b"NOPE" + bytes(20))
+    except ValueError:
+        return
+    raise AssertionError("from_bytes accepted a file that is not a replay")
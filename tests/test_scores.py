@@ -0,0 +1,34 @@
+import json
+
+from dodgeball.scores import ScoreLog
+
+
+def test_append_after_torn_last_line(tmp_path):
+    path = str(tmp_path / "scores.jsonl")
+    with open(path, 'w') as f:
+        f.write(json.dumps({"name": "a", "score": 10}) + "\n")
+        f.write('{"name": "b", "sco')  # crashed mid-write
+    log = ScoreLog(path)
+
+    log.append({"name": "c", "score": 30})
+
+    assert [e["name"] for e in log.load()] == ["a", "c"]
+    assert [e["name"] for e in log.top()] == ["c", "a"]
+    log.compact()
+    with open(path) as f:
+        assert [json.loads(line)["name"] for line in f] == ["a", "c"]
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    path = str(tmp_path / "scores.jsonl")
+    log = ScoreLog(path, top_k=2)
+    for name, score in (("a", 10), ("b", 20), ("c", 5)):
+        log.append({"name": name, "score": score})
+    assert [e["name"] for e in log.top()] == ["b", "a"]
+
+    # Written behind the index's back, e.g. by another copy of the game
+    with open(path, 'a') as f:
+        f.write(json.dumps({"name": "d", "score": 50}) + "\n")
+
+    assert [e["name"] for e in log.top()] == ["d", "b"]
+    assert [e["name"] for e in log.top(3)] == ["d", "b", "a"]
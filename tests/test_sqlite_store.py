@@ -0,0 +1,70 @@
+import json
+
+from dodgeball.scores import ScoreLog
+from dodgeball.sqlite_store import SqliteStore
+
+LEGACY = [{"name": "neutron", "score": 1805}, {"name": "proton", "score": 940}]
+
+
+def test_migration_imports_each_score_once(tmp_path):
+    legacy = str(tmp_path / "scores.json")
+    log_path = str(tmp_path / "scores.jsonl")
+    with open(legacy, 'w') as f:
+        json.dump(LEGACY, f)
+    # The JSON backend copied scores.json into the log and kept the original
+    log = ScoreLog(log_path, legacy)
+    log.append({"name": "electron", "score": 1200})
+
+    store = SqliteStore(str(tmp_path / "dodgeball.db"), (log_path, legacy))
+    assert [(e["name"], e["score"]) for e in store.load()] == [
+        ("neutron", 1805), ("proton", 940), ("electron", 1200)]
+    assert [e["name"] for e in store.top()] == ["neutron", "electron", "proton"]
+
+
+def test_migration_falls_back_to_legacy_scores(tmp_path):
+    legacy = str(tmp_path / "scores.json")
+    with open(legacy, 'w') as f:
+        json.dump(LEGACY, f)
+
+    store = SqliteStore(str(tmp_path / "dodgeball.db"), (str(tmp_path / "scores.jsonl"), legacy))
+    assert [(e["name"], e["score"]) for e in store.load()] == [("neutron", 1805), ("proton", 940)]
+
+
+def store_with_games(tmp_path):
+    store = SqliteStore(str(tmp_path / "dodgeball.db"))
+    for name, score, played_at in (("ann", 50, 1.0), ("bob", 70, 2.0), ("cat", 70, 3.0),
+                                   ("ann", 90, 4.0), ("bob", 30, 5.0), ("ann", 50, 6.0)):
+        store.append({"name": name, "score": score, "level": 1, "played_at": played_at})
+    return store
+
+
+def test_player_bests(tmp_path):
+    store = store_with_games(tmp_path)
+    # bob and cat tie on 70: by name
+    assert store.player_bests() == [{"name": "ann", "score": 90}, {"name": "bob", "score": 70},
+                                    {"name": "cat", "score": 70}]
+    assert store.player_bests(limit=2) == store.player_bests()[:2]
+    store.close()
+
+
+def test_player_top(tmp_path):
+    store = store_with_games(tmp_path)
+    # ann's two 50s tie: in the order they were played
+    assert [(e["score"], e["played_at"]) for e in store.player_top("ann")] == [
+        (90, 4.0), (50, 1.0), (50, 6.0)]
+    assert [e["score"] for e in store.player_top("ann", limit=1)] == [90]
+    assert store.player_top("nobody") == []
+    store.close()
+
+
+def test_recent(tmp_path):
+    store = store_with_games(tmp_path)
+    assert [(e["name"], e["played_at"]) for e in store.recent(3)] == [
+        ("ann", 6.0), ("bob", 5.0), ("ann", 4.0)]
+    store.append({"name": "dan", "score": 10, "played_at": 6.0})
+    # Same timestamp: the later insert first
+    assert [e["name"] for e in store.recent(2)] == ["dan", "ann"]
+    store.close()
+    # Reopens on next use
+    assert len(store.recent(100)) == 7
+    store.close()
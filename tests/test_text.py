@@ -0,0 +1,21 @@
+import pygame
+
+from dodgeball.text import TextCache
+
+
+def test_least_recently_used_surface_is_evicted():
+    pygame.font.init()
+    font = pygame.font.Font(None, 16)
+    cache = TextCache(maxsize=2)
+    a = cache.render(font, "a", (255, 255, 255))
+    cache.render(font, "b", (255, 255, 255))
+    assert cache.render(font, "a", (255, 255, 255)) is a
+    cache.render(font, "c", (255, 255, 255))  # evicts "b", used longest ago
+
+    assert len(cache.surfaces) == 2
+    assert cache.render(font, "a", (255, 255, 255)) is a
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.render(font, "b", (255, 255, 255))
+    assert cache.misses == 4
+    # Color is part of the key
+    assert cache.render(font, "b", (255, 0, 0)) is not cache.render(font, "b", (255, 255, 255))
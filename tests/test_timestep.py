@@ -0,0 +1,19 @@
+from dodgeball.timestep import FixedTimestep
+
+
+def test_whole_ticks_and_remainder():
+    timestep = FixedTimestep(tick_rate=50, max_catch_up=5)  # 20 ms ticks
+    assert timestep.advance(10) == 0
+    assert timestep.alpha == 0.5
+    assert timestep.advance(35) == 2
+    assert timestep.alpha == 0.25
+    timestep.reset()
+    assert timestep.alpha == 0.0
+    assert timestep.advance(19) == 0
+
+
+def test_catch_up_is_capped_and_the_rest_dropped():
+    timestep = FixedTimestep(tick_rate=50, max_catch_up=5)
+    assert timestep.advance(1000) == 5
+    assert timestep.alpha == 0.0
+    assert timestep.advance(20) == 1
@@ -0,0 +1,42 @@
+import pygame
+
+from dodgeball.touch import DpadTouch
+from dodgeball.world import LEFT, RIGHT, UP, DOWN
+
+
+def collidepoint_chain(cx, cy, arrow_size, x, y):
+    # The per-event test of the old Android build
+    half = arrow_size // 2
+    if pygame.Rect(cx - half, cy - arrow_size, arrow_size, arrow_size).collidepoint(x, y):
+        return UP
+    elif pygame.Rect(cx - arrow_size, cy - half, arrow_size, arrow_size).collidepoint(x, y):
+        return LEFT
+    elif pygame.Rect(cx, cy - half, arrow_size, arrow_size).collidepoint(x, y):
+        return RIGHT
+    elif pygame.Rect(cx - half, cy, arrow_size, arrow_size).collidepoint(x, y):
+        return DOWN
+    return 0
+
+
+def test_lookup_table_matches_collidepoint_chain():
+    touch = DpadTouch()
+    for (cx, cy), arrow_size in (((100, 500), 40), ((100, 380), 41), ((30, 30), 25), ((7, 9), 12)):
+        touch.layout((cx, cy), arrow_size, (800, 600))
+        for y in range(cy - arrow_size - 3, cy + arrow_size + 4):
+            for x in range(cx - arrow_size - 3, cx + arrow_size + 4):
+                assert touch.direction_at(x, y) == collidepoint_chain(cx, cy, arrow_size, x, y), \
+                    (cx, cy, arrow_size, x, y)
+
+
+def test_fingers_hold_directions_until_lifted():
+    touch = DpadTouch()
+    touch.layout((100, 500), 40, (800, 600))
+    touch.press("a", 100, 470)
+    touch.press("b", 130, 500)
+    assert touch.held == UP | RIGHT
+    touch.press("a", 70, 500)
+    assert touch.held == LEFT | RIGHT
+    touch.release("b")
+    assert touch.held == LEFT
+    touch.release_all()
+    assert touch.held == 0
@@ -0,0 +1,62 @@
+import numpy as np
+
+from dodgeball import LEFT, RIGHT, UP, DOWN, World
+
+# Sizes the window is resized to, by tick
+RESIZES = {400: (640, 480), 1100: (1024, 768), 1900: (800, 600)}
+
+
+def policy(ticks):
+    return [0, LEFT, RIGHT, UP, DOWN, LEFT | UP, RIGHT | DOWN][(ticks // 29) % 7]
+
+
+def state(world):
+    n = world.obstacles.count
+    return (world.score, world.level, world.lives, world.ticks, world.ball_x, world.ball_y,
+            world.power_up and tuple(world.power_up), world.obstacles.ids[:n].tolist(),
+            world.obstacles.x[:n].tolist(), world.obstacles.y[:n].tolist())
+
+
+def test_broadphase_matches_vectorized_test():
+    for seed in range(8):
+        plain = World(seed=seed)
+        grid = World(broadphase=True, seed=seed)
+        while not plain.game_over and plain.ticks < 3000:
+            if plain.ticks in RESIZES:
+                plain.resize(*RESIZES[plain.ticks])
+                grid.resize(*RESIZES[grid.ticks])
+            inputs = policy(plain.ticks)
+            assert plain.step(inputs) == grid.step(inputs)
+            assert state(plain) == state(grid)
+        assert grid.game_over == plain.game_over
+
+
+def test_same_seed_same_session():
+    a = World(seed=1234)
+    b = World(seed=1234)
+    for _ in range(2000):
+        a.step(policy(a.ticks))
+        b.step(policy(b.ticks))
+    assert state(a) == state(b)
+    assert np.array_equal(a.obstacles.color_index[:a.obstacles.count],
+                          b.obstacles.color_index[:b.obstacles.count])
+
+
+def test_shrinking_the_window_keeps_everything_inside():
+    world = World(seed=3)
+    for _ in range(300):
+        world.step(RIGHT)
+    assert world.obstacles.count and world.ball_x > 640 - 15
+
+    world.resize(640, 400)
+    r = 15
+    assert world.ball_x <= 640 - r and world.ball_y <= 400 - r
+    assert world.ball_pos(0.0) == (world.prev_ball_x, world.prev_ball_y)
+    assert world.prev_ball_x <= 640 - r and world.prev_ball_y <= 400 - r
+    n = world.obstacles.count
+    assert (world.obstacles.x[:n] <= 640 - world.obstacles.width).all()
+
+    # The ball is still in the obstacles' way, so the session can end
+    while not world.game_over and world.ticks < 20000:
+        world.step(0)
+    assert world.game_over
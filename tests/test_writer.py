@@ -0,0 +1,32 @@
+import threading
+
+from dodgeball.writer import BackgroundWriter
+
+
+def test_queued_jobs_with_the_same_key_run_once():
+    writer = BackgroundWriter()
+    gate = threading.Event()
+    ran = []
+    # Hold the thread so the jobs below are still queued when resubmitted
+    writer.submit(gate.wait)
+    writer.submit(ran.append, ("settings", 1), key="settings")
+    writer.submit(ran.append, ("score", 10))
+    writer.submit(ran.append, ("settings", 2), key="settings")
+    writer.submit(ran.append, ("settings", 3), key="settings")
+    assert writer.busy()
+    gate.set()
+    writer.flush()
+
+    assert ran == [("settings", 3), ("score", 10)]
+    assert not writer.busy()
+
+
+def test_a_failing_job_does_not_stop_the_next(capsys):
+    writer = BackgroundWriter()
+    ran = []
+    writer.submit(lambda: 1 / 0)
+    writer.submit(ran.append, "after")
+    writer.flush()
+
+    assert ran == ["after"]
+    assert "ZeroDivisionError" in capsys.readouterr().err
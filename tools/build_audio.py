@@ -0,0 +1,43 @@
+# Offline build step: writes a compressed .ogg next to every .wav asset.
+# The game picks the .ogg up automatically and falls back to the .wav when
+# it is missing. Needs ffmpeg (or oggenc) on PATH.
+#
+#   python tools/build_audio.py [--quality Q] [--force]
+
+import argparse
+import glob
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def encode(src, dst, quality):
+    if shutil.which("ffmpeg"):
+        cmd = ["ffmpeg", "-loglevel", "error", "-y", "-i", src,
+               "-c:a", "libvorbis", "-q:a", str(quality), dst]
+    elif shutil.which("oggenc"):
+        cmd = ["oggenc", "--quiet", "-q", str(quality), "-o", dst, src]
+    else:
+        sys.exit("build_audio: neither ffmpeg nor oggenc found on PATH")
+    subprocess.run(cmd, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compress the game's WAV assets to OGG")
+    parser.add_argument("--quality", type=int, default=4, help="Vorbis quality, 0-10")
+    parser.add_argument("--force", action="store_true", help="rebuild up-to-date files too")
+    args = parser.parse_args()
+
+    for src in sorted(glob.glob(os.path.join(ROOT, "*.wav"))):
+        dst = os.path.splitext(src)[0] + ".ogg"
+        if not args.force and os.path.exists(dst) and os.path.getmtime(dst) >= os.path.getmtime(src):
+            continue
+        encode(src, dst, args.quality)
+        print(f"{os.path.basename(src)}: {os.path.getsize(src)} -> {os.path.getsize(dst)} bytes")
+
+
+if __name__ == "__main__":
+    main()